@@ -0,0 +1,268 @@
+"""
+Benchmark suite for the hotspot manager, run against the load simulation
+
+Measures start/stop time, /api/status latency percentiles with M concurrent
+pollers, forks per second and RSS growth, and writes the results as JSON.
+
+Usage:
+    python3 -m bench.benchmark --clients 200 --pollers 4 --duration 60
+    python3 -m bench.benchmark --duration 7200 --output run.json --baseline previous.json
+"""
+
+import argparse
+import gzip
+import json
+import math
+import platform
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+import psutil
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from bench.sim import Simulation
+
+# Lower is better for every compared metric
+COMPARED_METRICS = [
+    ('startSeconds',),
+    ('stopSeconds',),
+    ('status', 'p50Ms'),
+    ('status', 'p90Ms'),
+    ('status', 'p99Ms'),
+    ('status', 'bytesPerResponse'),
+    ('forks', 'perSecond'),
+    ('rss', 'growthBytesPerHour'),
+]
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values), math.ceil(pct / 100 * len(sorted_values))) - 1)
+    return sorted_values[rank]
+
+
+class RssSampler(threading.Thread):
+    """Sample this process's RSS at a fixed interval"""
+
+    def __init__(self, interval):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self.stop_event = threading.Event()
+        self.process = psutil.Process()
+
+    def sample(self):
+        self.samples.append((time.monotonic(), self.process.memory_info().rss))
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.sample()
+
+    def summary(self):
+        if len(self.samples) < 2:
+            return None
+        (t0, start), (t1, end) = self.samples[0], self.samples[-1]
+        hours = (t1 - t0) / 3600
+        return {
+            'startBytes': start,
+            'endBytes': end,
+            'maxBytes': max(rss for _, rss in self.samples),
+            'samples': len(self.samples),
+            'growthBytesPerHour': round((end - start) / hours) if hours else 0
+        }
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def poll_status(base_url, deadline, interval, delta, latencies, totals, lock):
+    """One dashboard-like poller hitting /api/status until the deadline"""
+    since = None
+    while time.monotonic() < deadline:
+        url = f'{base_url}/api/status'
+        headers = {'Accept-Encoding': 'gzip'}
+        if delta and since is not None:
+            url += f'?since={since}'
+            headers['If-None-Match'] = f'W/"{since}"'
+
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as response:
+                body = response.read()
+                encoding = response.headers.get('Content-Encoding')
+            code = 200
+        except urllib.error.HTTPError as e:
+            body, encoding, code = b'', None, e.code
+        elapsed = time.perf_counter() - started
+
+        if code == 200:
+            data = json.loads(gzip.decompress(body) if encoding == 'gzip' else body)
+            since = data.get('version')
+
+        with lock:
+            latencies.append(elapsed)
+            totals['requests'] += 1
+            totals['bytes'] += len(body)
+            totals['notModified'] += code == 304
+            totals['errors'] += code not in (200, 304)
+
+        if interval:
+            time.sleep(max(0, interval - elapsed))
+
+
+def run_benchmark(args):
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scenario': {
+            'clients': args.clients,
+            'churn': args.churn,
+            'logRate': args.log_rate,
+            'signalJitter': not args.no_signal_jitter,
+            'pollers': args.pollers,
+            'pollInterval': args.poll_interval,
+            'delta': args.delta,
+            'duration': args.duration
+        }
+    }
+
+    with Simulation(clients=args.clients, churn=args.churn, log_rate=args.log_rate,
+                    signal_jitter=not args.no_signal_jitter) as sim:
+        import app
+
+        manager = app.init_manager(sim.create_manager())
+
+        started = time.perf_counter()
+        result = manager.start(sim.config())
+        results['startSeconds'] = round(time.perf_counter() - started, 3)
+        if not result.get('success'):
+            raise RuntimeError(f"Simulated start failed: {result}")
+
+        # Let the fake hostapd announce its stations and dnsmasq write leases
+        time.sleep(args.warmup)
+
+        server = make_server('127.0.0.1', 0, app.app, threaded=True,
+                             request_handler=QuietRequestHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_port}'
+
+        latencies = []
+        totals = {'requests': 0, 'bytes': 0, 'notModified': 0, 'errors': 0}
+        lock = threading.Lock()
+        calls_before = sim.calls()
+        poll_started = time.monotonic()
+        deadline = poll_started + args.duration
+
+        # RSS growth is measured over the steady-state polling phase
+        sampler = RssSampler(args.rss_interval)
+        sampler.sample()
+        sampler.start()
+
+        pollers = [
+            threading.Thread(target=poll_status, daemon=True,
+                             args=(base_url, deadline, args.poll_interval, args.delta,
+                                   latencies, totals, lock))
+            for _ in range(args.pollers)
+        ]
+        for poller in pollers:
+            poller.start()
+        for poller in pollers:
+            poller.join()
+
+        poll_seconds = time.monotonic() - poll_started
+        calls = sim.calls() - calls_before
+        server.shutdown()
+
+        sampler.stop_event.set()
+        sampler.join()
+        sampler.sample()
+
+        started = time.perf_counter()
+        manager.stop()
+        results['stopSeconds'] = round(time.perf_counter() - started, 3)
+
+    latencies.sort()
+    results['status'] = {
+        'requests': totals['requests'],
+        'errors': totals['errors'],
+        'notModified': totals['notModified'],
+        'requestsPerSecond': round(totals['requests'] / poll_seconds, 2),
+        'bytesPerResponse': round(totals['bytes'] / totals['requests']) if totals['requests'] else 0,
+        'meanMs': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else None,
+        'p50Ms': round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        'p90Ms': round(percentile(latencies, 90) * 1000, 3) if latencies else None,
+        'p99Ms': round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+        'maxMs': round(latencies[-1] * 1000, 3) if latencies else None
+    }
+    results['forks'] = {
+        'total': sum(calls.values()),
+        'perSecond': round(sum(calls.values()) / poll_seconds, 2),
+        'byCommand': dict(calls)
+    }
+    results['rss'] = sampler.summary()
+    return results
+
+
+def compare(results, baseline):
+    """Relative change of each compared metric against a previous run"""
+    comparison = {}
+    for path in COMPARED_METRICS:
+        current, previous = results, baseline
+        for key in path:
+            current = (current or {}).get(key)
+            previous = (previous or {}).get(key)
+        if current is None or previous is None:
+            continue
+        change = round((current - previous) / previous * 100, 1) if previous else None
+        comparison['.'.join(path)] = {'baseline': previous, 'current': current, 'changePercent': change}
+    return comparison
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='bench.benchmark', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=200, help='simulated stations (default: 200)')
+    parser.add_argument('--churn', type=float, default=1.0, help='station reconnects per second')
+    parser.add_argument('--log-rate', type=float, default=20.0, help='hostapd noise lines per second')
+    parser.add_argument('--no-signal-jitter', action='store_true',
+                        help='keep station signal constant (an idle, unchanging AP)')
+    parser.add_argument('--pollers', type=int, default=4, help='concurrent /api/status pollers')
+    parser.add_argument('--poll-interval', type=float, default=2.0,
+                        help='seconds between polls per poller, 0 for back-to-back (default: 2, like the UI)')
+    parser.add_argument('--delta', action='store_true', help='poll with ?since=<version> like the UI')
+    parser.add_argument('--duration', type=float, default=30.0, help='polling phase length in seconds')
+    parser.add_argument('--warmup', type=float, default=2.0, help='seconds between start and polling')
+    parser.add_argument('--rss-interval', type=float, default=5.0, help='RSS sampling interval in seconds')
+    parser.add_argument('--output', help='write JSON results to this file (default: stdout)')
+    parser.add_argument('--baseline', help='previous results JSON to compare against')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = run_benchmark(args)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            results['comparison'] = compare(results, json.load(f))
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
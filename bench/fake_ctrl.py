@@ -0,0 +1,151 @@
+"""
+Stand-in hostapd control socket for band steering simulations
+
+Serves the subset of the ctrl_interface protocol the steering engine uses
+(PING, ATTACH/DETACH/LEVEL, STATUS, STA/STA-FIRST/STA-NEXT, DENY_ACL,
+BSS_TM_REQ) on a real AF_UNIX datagram socket and lets the simulation
+inject events. Like hostapd, events are only delivered to monitors whose
+LEVEL is at or below the event's level, and denying an associated station
+disassociates it.
+"""
+
+import os
+import re
+import socket
+import threading
+
+# hostapd debug levels (wpa_debug.h); monitors start at MSG_INFO
+MSG_EXCESSIVE = 0
+MSG_INFO = 3
+
+MAC_RE = re.compile(r'[0-9a-f]{2}(?::[0-9a-f]{2}){5}')
+
+
+class FakeHostapdCtrl:
+    """One interface's control socket"""
+
+    def __init__(self, ctrl_dir, interface, bssid, channel, on_btm_request=None,
+                 on_disassociate=None):
+        self.path = os.path.join(ctrl_dir, interface)
+        self.interface = interface
+        self.bssid = bssid
+        self.channel = channel
+        self.on_btm_request = on_btm_request
+        self.on_disassociate = on_disassociate
+        self.denied = set()
+        self.stations = []
+        self.attached = {}
+        self.commands = []
+        self.lock = threading.Lock()
+        self.sock = None
+        self.thread = None
+
+    def start(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(self.path)
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def serve(self):
+        while self.sock:
+            try:
+                data, address = self.sock.recvfrom(65536)
+            except OSError:
+                return
+            reply = self.handle(data.decode(errors='replace').strip(), address)
+            try:
+                self.sock.sendto(reply.encode(), address)
+            except OSError:
+                pass
+
+    def handle(self, command, address):
+        parts = command.split()
+        if not parts:
+            return 'UNKNOWN COMMAND\n'
+
+        with self.lock:
+            self.commands.append(command)
+            if parts[0] == 'PING':
+                return 'PONG\n'
+            if parts[0] == 'ATTACH':
+                self.attached[address] = MSG_INFO
+                return 'OK\n'
+            if parts[0] == 'DETACH':
+                self.attached.pop(address, None)
+                return 'OK\n'
+            if parts[0] == 'LEVEL' and len(parts) == 2:
+                if address not in self.attached:
+                    return 'FAIL\n'
+                self.attached[address] = int(parts[1])
+                return 'OK\n'
+            if parts[0] == 'STA-FIRST':
+                return self.station_reply(self.stations[0]) if self.stations else ''
+            if parts[0] == 'STA-NEXT' and len(parts) == 2:
+                mac = parts[1].lower()
+                if mac not in self.stations:
+                    return 'FAIL\n'
+                index = self.stations.index(mac) + 1
+                return self.station_reply(self.stations[index]) if index < len(self.stations) else ''
+            if parts[0] == 'STA' and len(parts) == 2:
+                mac = parts[1].lower()
+                return self.station_reply(mac) if mac in self.stations else 'FAIL\n'
+            if parts[0] == 'STATUS':
+                return (f'state=ENABLED\nchannel={self.channel}\n'
+                        f'bssid[0]={self.bssid}\nssid[0]=Sim-Hotspot\nnum_sta[0]=0\n')
+            if parts[0] == 'DENY_ACL' and len(parts) == 3:
+                mac = parts[2].lower()
+                if parts[1] == 'ADD_MAC':
+                    self.denied.add(mac)
+                    kicked = mac in self.stations
+                elif parts[1] == 'DEL_MAC':
+                    self.denied.discard(mac)
+                    kicked = False
+                else:
+                    return 'FAIL\n'
+
+        if parts[0] == 'DENY_ACL' and len(parts) == 3:
+            # hostapd disassociates a station as soon as it is denied
+            if kicked:
+                self.emit(f'AP-STA-DISCONNECTED {mac}')
+                if self.on_disassociate:
+                    self.on_disassociate(self, mac)
+            return 'OK\n'
+
+        if parts[0] == 'BSS_TM_REQ' and len(parts) >= 2:
+            if self.on_btm_request:
+                self.on_btm_request(self, parts[1].lower(), command)
+            return 'OK\n'
+
+        return 'UNKNOWN COMMAND\n'
+
+    def station_reply(self, mac):
+        return f'{mac}\nflags=[AUTH][ASSOC][AUTHORIZED]\naid={self.stations.index(mac) + 1}\n'
+
+    def is_denied(self, mac):
+        with self.lock:
+            return mac in self.denied
+
+    def emit(self, event, level=MSG_INFO):
+        """Send an unsolicited event to the monitors listening at its level"""
+        match = MAC_RE.search(event)
+        with self.lock:
+            # Keep the station table in step with (dis)association events
+            if match and event.startswith('AP-STA-CONNECTED') and match.group(0) not in self.stations:
+                self.stations.append(match.group(0))
+            elif match and event.startswith('AP-STA-DISCONNECTED') and match.group(0) in self.stations:
+                self.stations.remove(match.group(0))
+            attached = [address for address, monitor_level in self.attached.items()
+                        if level >= monitor_level]
+        for address in attached:
+            try:
+                self.sock.sendto(f'<{level}>{event}'.encode(), address)
+            except OSError:
+                pass
@@ -0,0 +1,53 @@
+"""
+Shared helpers for the stand-in executables used by the load simulation
+Everything lives in $HOTSPOT_SIM_DIR, created by bench/sim.py
+"""
+
+import json
+import os
+import sys
+import time
+
+SIM_DIR = os.environ.get('HOTSPOT_SIM_DIR', '/tmp/hotspot_sim')
+CALLS_LOG = os.path.join(SIM_DIR, 'calls.log')
+SCENARIO_FILE = os.path.join(SIM_DIR, 'scenario.json')
+STATIONS_FILE = os.path.join(SIM_DIR, 'stations.json')
+LEASES_FILE = os.path.join(SIM_DIR, 'dnsmasq.leases')
+
+
+def log_call(name):
+    """Record one invocation (one fork/exec by the manager)"""
+    line = f"{time.time():.6f} {name} {' '.join(sys.argv[1:])}\n"
+    fd = os.open(CALLS_LOG, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
+
+
+def load_scenario():
+    try:
+        with open(SCENARIO_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_stations():
+    try:
+        with open(STATIONS_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_atomic(path, text):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def mac_for(index):
+    """Locally administered MAC for simulated station `index`"""
+    return f'02:00:00:{(index >> 16) & 255:02x}:{(index >> 8) & 255:02x}:{index & 255:02x}'
@@ -0,0 +1,232 @@
+"""
+Band steering simulation against two fake hostapd control sockets
+
+Dual-band clients prefer the 2.4 GHz AP (the sticky behaviour steering is
+meant to fix); some honour 802.11v BSS transition requests. Some stations
+are already associated before steering attaches, as after a restart. Runs
+the real BandSteering engine and reports its counters, the final per-band
+load and how many stations the deny list kicked off as JSON. Run with
+--no-steering for the unsteered baseline.
+
+Usage:
+    python3 -m bench.steering_sim --clients 60 --duration 30
+    python3 -m bench.steering_sim --clients 60 --duration 30 --no-steering
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from bench.fake_ctrl import MSG_EXCESSIVE, FakeHostapdCtrl
+from steering import BandSteering
+
+# Accelerated timings so a run takes seconds, not hours
+SIM_OPTIONS = {
+    'probeWindow': 10,
+    'holdTime': 2,
+    'maxHoldProbes': 6,
+    'loadImbalance': 4,
+    'maxSteerPerRound': 3,
+    'steerCooldown': 10,
+    'btmTimeout': 2,
+    'interval': 1
+}
+
+BANDS = ('2.4', '5')
+
+
+class Station:
+    def __init__(self, index, rng, dual_band_ratio, btm_ratio):
+        self.mac = f'02:00:00:01:{(index >> 8) & 255:02x}:{index & 255:02x}'
+        self.dual_band = rng.random() < dual_band_ratio
+        self.btm = self.dual_band and rng.random() < btm_ratio
+        self.signal = {'2.4': rng.randint(-70, -40)}
+        self.signal['5'] = self.signal['2.4'] - rng.randint(3, 12)
+        self.band = None
+        self.move_to = None
+
+
+class SteeringSimulation:
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.stations = [Station(i, self.rng, args.dual_band, args.btm_support)
+                         for i in range(args.clients)]
+        self.by_mac = {station.mac: station for station in self.stations}
+        self.ctrl_dir = tempfile.mkdtemp(prefix='hotspot_ctrl_sim_')
+        self.ctrls = {
+            '2.4': FakeHostapdCtrl(self.ctrl_dir, 'wlan0', '02:aa:00:00:00:24', 6,
+                                   self.btm_request, self.disassociated),
+            '5': FakeHostapdCtrl(self.ctrl_dir, 'wlan1', '02:aa:00:00:00:50', 36,
+                                 self.btm_request, self.disassociated)
+        }
+        self.band_of = {self.ctrls[band].interface: band for band in BANDS}
+        self.preassociated = 0
+        self.kicked = 0
+        self.log_lines = []
+        self.lock = threading.Lock()
+
+    def btm_request(self, ctrl, mac, command):
+        """A station answers a BSS transition request"""
+        station = self.by_mac.get(mac)
+        if not station:
+            return
+        from_band = self.band_of[ctrl.interface]
+        if station.btm:
+            ctrl.emit(f'BSS-TM-RESP {mac} dialog_token=1 status_code=0 '
+                      f'bss_termination_delay=0 target_bssid=00:00:00:00:00:00')
+            with self.lock:
+                station.move_to = '5' if from_band == '2.4' else '2.4'
+        else:
+            ctrl.emit(f'BSS-TM-RESP {mac} dialog_token=1 status_code=1 bss_termination_delay=0')
+
+    def disassociated(self, ctrl, mac):
+        """hostapd dropped an associated station it was told to deny"""
+        station = self.by_mac.get(mac)
+        with self.lock:
+            if station and station.band == self.band_of[ctrl.interface]:
+                station.band = None
+                self.kicked += 1
+
+    def probe(self, station, band):
+        # Like hostapd, probe requests are only reported at MSG_EXCESSIVE
+        signal = station.signal[band] + self.rng.randint(-2, 2)
+        self.ctrls[band].emit(f'RX-PROBE-REQUEST sa={station.mac} signal={signal}', level=MSG_EXCESSIVE)
+
+    def connect(self, station, band):
+        station.band = band
+        self.ctrls[band].emit(f'AP-STA-CONNECTED {station.mac}')
+
+    def disconnect(self, station):
+        band, station.band = station.band, None
+        if band:
+            self.ctrls[band].emit(f'AP-STA-DISCONNECTED {station.mac}')
+
+    def tick(self, arrived):
+        for index, station in enumerate(self.stations):
+            if index >= arrived and station.band is None:
+                continue
+
+            with self.lock:
+                move_to, station.move_to = station.move_to, None
+
+            if move_to and station.band:
+                self.disconnect(station)
+                self.connect(station, move_to)
+                continue
+
+            if station.band:
+                # Background scans keep the steering engine's probe records fresh
+                if self.rng.random() < 0.05:
+                    for band in (BANDS if station.dual_band else ('2.4',)):
+                        self.probe(station, band)
+                continue
+
+            self.probe(station, '2.4')
+            if station.dual_band:
+                self.probe(station, '5')
+
+            # Sticky clients go for 2.4 GHz unless it refuses them
+            if not self.ctrls['2.4'].is_denied(station.mac):
+                if self.rng.random() < 0.5:
+                    band = '5' if station.dual_band and self.rng.random() < 0.2 else '2.4'
+                    self.connect(station, band)
+            elif station.dual_band and self.rng.random() < 0.3:
+                self.connect(station, '5')
+
+    def run(self):
+        for ctrl in self.ctrls.values():
+            ctrl.start()
+
+        # Stations that associated (stickily, on 2.4 GHz) before steering attached
+        for station in self.stations:
+            if self.rng.random() < self.args.preassociated:
+                self.connect(station, '2.4')
+                self.preassociated += 1
+
+        steering = None
+        if not self.args.no_steering:
+            steering = BandSteering({band: self.ctrls[band].interface for band in BANDS},
+                                    options=SIM_OPTIONS, log=self.log_lines.append,
+                                    ctrl_dir=self.ctrl_dir)
+            steering.start()
+
+        try:
+            started = time.monotonic()
+            tick = 0.1
+            while time.monotonic() - started < self.args.duration:
+                elapsed = time.monotonic() - started
+                arrived = min(len(self.stations), int(elapsed * self.args.arrival_rate) + 1)
+                self.tick(arrived)
+                time.sleep(tick)
+
+            # Let in-flight events settle
+            time.sleep(0.5)
+            stats = steering.get_stats() if steering else None
+        finally:
+            if steering:
+                steering.stop()
+            for ctrl in self.ctrls.values():
+                ctrl.stop()
+            shutil.rmtree(self.ctrl_dir, ignore_errors=True)
+
+        load = {band: sum(1 for s in self.stations if s.band == band) for band in BANDS}
+        dual_on_legacy = sum(1 for s in self.stations if s.dual_band and s.band == '2.4')
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'scenario': {
+                'clients': self.args.clients,
+                'dualBand': self.args.dual_band,
+                'btmSupport': self.args.btm_support,
+                'arrivalRate': self.args.arrival_rate,
+                'preassociated': self.args.preassociated,
+                'duration': self.args.duration,
+                'steering': not self.args.no_steering,
+                'options': SIM_OPTIONS
+            },
+            'load': load,
+            'dualBandOn24': dual_on_legacy,
+            'preassociated': self.preassociated,
+            'disassociatedByDeny': self.kicked,
+            'unassociated': sum(1 for s in self.stations if s.band is None),
+            'counters': stats['counters'] if stats else None,
+            'decisions': len(self.log_lines)
+        }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='bench.steering_sim', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=60)
+    parser.add_argument('--dual-band', type=float, default=0.7, help='fraction of 5 GHz capable clients')
+    parser.add_argument('--btm-support', type=float, default=0.6, help='fraction of dual-band clients honouring BTM')
+    parser.add_argument('--arrival-rate', type=float, default=5.0, help='clients arriving per second')
+    parser.add_argument('--preassociated', type=float, default=0.3,
+                        help='fraction of clients associated before steering starts')
+    parser.add_argument('--duration', type=float, default=30.0)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--no-steering', action='store_true', help='run without the steering engine')
+    parser.add_argument('--output', help='write JSON results to this file (default: stdout)')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = SteeringSimulation(args).run()
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
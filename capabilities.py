@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Capability probe for hostapd, dnsmasq and the wireless radios
+Results are memoized and only re-probed when a binary, radio or regdomain changes
+"""
+
+import mmap
+import os
+import re
+import shutil
+import subprocess
+import threading
+
+# Directories searched in addition to PATH (sudo often drops the sbin dirs)
+SBIN_DIRS = ['/usr/local/sbin', '/usr/sbin', '/sbin']
+
+# iw band numbers to the freqBand values used by the config
+IW_BANDS = {'1': '2.4', '2': '5', '3': '60', '4': '6'}
+
+# Strings that only end up in the hostapd binary when the matching
+# build option is enabled (config parser keywords / module debug prefixes)
+HOSTAPD_FEATURE_MARKERS = {
+    'ieee80211n': [b'ht_capab'],
+    'ieee80211ac': [b'vht_capab'],
+    'ieee80211ax': [b'he_su_beamformer'],
+    'ieee80211be': [b'eht_su_beamformer'],
+    'sae': [b'SAE: '],
+}
+
+_cache = {'key': None, 'value': None}
+_cache_lock = threading.Lock()
+
+
+def find_binary(name):
+    """Resolve a binary in-process and return its path and mtime"""
+    search_path = os.pathsep.join([os.environ.get('PATH', '')] + SBIN_DIRS)
+    path = shutil.which(name, path=search_path)
+    if not path:
+        return None
+    try:
+        return {'path': path, 'mtime': os.stat(path).st_mtime_ns}
+    except OSError:
+        return None
+
+
+def list_phys():
+    """List wireless radios known to the kernel"""
+    try:
+        return sorted(os.listdir('/sys/class/ieee80211'))
+    except OSError:
+        return []
+
+
+def wireless_interfaces():
+    """Map wireless interface names to their phy"""
+    interfaces = {}
+    try:
+        names = os.listdir('/sys/class/net')
+    except OSError:
+        return interfaces
+
+    for name in names:
+        try:
+            with open(f'/sys/class/net/{name}/phy80211/name', 'r') as f:
+                interfaces[name] = f.read().strip()
+        except OSError:
+            pass
+    return interfaces
+
+
+def scan_binary(path, markers):
+    """Look for feature marker strings inside a binary"""
+    try:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return {
+                    feature: any(data.find(m) != -1 for m in patterns)
+                    for feature, patterns in markers.items()
+                }
+    except (OSError, ValueError):
+        return None
+
+
+def probe_hostapd(binary):
+    """Read hostapd version and compiled features"""
+    if not binary:
+        return None
+
+    version = None
+    try:
+        result = subprocess.run([binary['path'], '-v'], capture_output=True,
+                                text=True, timeout=2)
+        match = re.search(r'hostapd v(\S+)', result.stdout + result.stderr)
+        if match:
+            version = match.group(1)
+    except Exception:
+        pass
+
+    return {
+        'version': version,
+        'features': scan_binary(binary['path'], HOSTAPD_FEATURE_MARKERS)
+    }
+
+
+def probe_dnsmasq(binary):
+    """Read dnsmasq version and compile time options"""
+    if not binary:
+        return None
+
+    version = None
+    options = []
+    try:
+        result = subprocess.run([binary['path'], '--version'], capture_output=True,
+                                text=True, timeout=2)
+        match = re.search(r'Dnsmasq version (\S+)', result.stdout)
+        if match:
+            version = match.group(1)
+        match = re.search(r'Compile time options:\s*(.*)', result.stdout)
+        if match:
+            options = match.group(1).split()
+    except Exception:
+        pass
+
+    return {'version': version, 'options': options}
+
+
+def parse_iw_phy(output):
+    """Parse `iw phy` output into per-radio capabilities"""
+    phys = {}
+    phy = None
+    band = None
+    section = None
+
+    for raw in output.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        depth = len(raw) - len(raw.lstrip('\t'))
+
+        if depth == 0:
+            match = re.match(r'Wiphy (\S+)', line)
+            phy = None
+            if match:
+                phy = phys.setdefault(match.group(1), {
+                    'bands': {}, 'modes': [], 'combinations': [], 'ap': False
+                })
+            section = None
+            continue
+
+        if phy is None:
+            continue
+
+        if depth == 1:
+            match = re.match(r'Band (\d+):', line)
+            if match:
+                band = {
+                    'ht': False, 'vht': False, 'he': False, 'heAP': False,
+                    'channels': [], 'disabledChannels': [], 'noIRChannels': [], 'dfsChannels': []
+                }
+                phy['bands'][IW_BANDS.get(match.group(1), match.group(1))] = band
+                section = 'band'
+            elif line.startswith('Supported interface modes'):
+                section = 'modes'
+            elif line.startswith('valid interface combinations'):
+                section = 'combinations'
+            else:
+                section = None
+            continue
+
+        if section == 'modes':
+            if line.startswith('*'):
+                phy['modes'].append(line[1:].strip())
+        elif section == 'combinations':
+            if line.startswith('*'):
+                phy['combinations'].append(line[1:].strip())
+            elif phy['combinations']:
+                phy['combinations'][-1] += ' ' + line
+        elif section == 'band':
+            if line.startswith(('HT20', 'HT TX/RX MCS', 'HT Max RX')):
+                band['ht'] = True
+            elif line.startswith('VHT Capabilities'):
+                band['vht'] = True
+            elif line.startswith('HE Iftypes'):
+                band['he'] = True
+                iftypes = re.split(r'[,\s]+', line.split(':', 1)[1].strip())
+                if 'AP' in iftypes:
+                    band['heAP'] = True
+            else:
+                match = re.match(r'\* [\d.]+ MHz \[(\d+)\](.*)', line)
+                if match:
+                    channel, flags = int(match.group(1)), match.group(2)
+                    if 'disabled' in flags:
+                        band['disabledChannels'].append(channel)
+                    elif 'radar detection' in flags:
+                        # DFS: also no-IR, but hostapd may start an AP after the CAC
+                        band['channels'].append(channel)
+                        band['dfsChannels'].append(channel)
+                    elif 'no IR' in flags or 'passive scan' in flags:
+                        # Regulatory domain forbids initiating radiation, no AP here
+                        band['noIRChannels'].append(channel)
+                    else:
+                        band['channels'].append(channel)
+
+    for phy in phys.values():
+        phy['ap'] = 'AP' in phy['modes']
+
+    return phys
+
+
+def probe_phys(binary):
+    """Read radio capabilities from `iw phy`"""
+    if not binary:
+        return {}
+
+    try:
+        result = subprocess.run([binary['path'], 'phy'], capture_output=True,
+                                text=True, timeout=5)
+        if result.returncode == 0:
+            return parse_iw_phy(result.stdout)
+    except Exception:
+        pass
+    return {}
+
+
+def probe_regdomain(binary):
+    """Current global regulatory domain from `iw reg get` (e.g. 'US', '00')"""
+    if not binary:
+        return None
+
+    try:
+        result = subprocess.run([binary['path'], 'reg', 'get'], capture_output=True,
+                                text=True, timeout=2)
+        match = re.search(r'^country (\S+):', result.stdout, re.MULTILINE)
+        if match:
+            return match.group(1)
+    except Exception:
+        pass
+    return None
+
+
+def get_capabilities(refresh=False):
+    """Return memoized capabilities, re-probing when a binary, radio or regdomain changed"""
+    binaries = {name: find_binary(name) for name in ('hostapd', 'dnsmasq', 'iw')}
+    regdomain = probe_regdomain(binaries['iw'])
+    key = (
+        tuple((name, (info['path'], info['mtime']) if info else None)
+              for name, info in sorted(binaries.items())),
+        tuple(list_phys()),
+        regdomain
+    )
+
+    with _cache_lock:
+        if refresh or _cache['key'] != key:
+            _cache['value'] = {
+                'binaries': binaries,
+                'hostapd': probe_hostapd(binaries['hostapd']),
+                'dnsmasq': probe_dnsmasq(binaries['dnsmasq']),
+                'phys': probe_phys(binaries['iw']),
+                'regdomain': regdomain
+            }
+            _cache['key'] = key
+        capabilities = _cache['value']
+
+    return dict(capabilities, interfaces=wireless_interfaces())
+
+
+def validate_config(config, capabilities):
+    """Return the settings in config this system cannot support"""
+    errors = []
+
+    hostapd = capabilities.get('hostapd') or {}
+    features = hostapd.get('features') or {}
+    version = hostapd.get('version') or 'unknown version'
+
+    if config.get('ieee80211ax') and features.get('ieee80211ax') is False:
+        errors.append(f"hostapd ({version}) was built without CONFIG_IEEE80211AX, "
+                      "see INSTALL_HOSTAPD_2.11.md")
+
+    if config.get('password') and config.get('wpaVersion') == '3' and features.get('sae') is False:
+        errors.append(f"hostapd ({version}) was built without SAE, WPA3 is not available")
+
+    interface = config.get('wifiInterface', 'wlan0')
+    if config.get('bandSteering'):
+        peer = config.get('steeringInterface')
+        if not peer:
+            errors.append("Band steering needs the interface of the AP on the other band")
+        elif peer == interface:
+            errors.append("Band steering peer must be a different interface than the hotspot")
+
+    phy = capabilities['phys'].get(capabilities['interfaces'].get(interface))
+    if not phy:
+        # Radio unknown to iw, leave the rest to hostapd
+        return errors
+
+    if not phy['ap']:
+        errors.append(f"{interface} does not support AP mode")
+
+    freq_band = config.get('freqBand', '2.4')
+    band = phy['bands'].get(freq_band)
+    if band is None:
+        errors.append(f"{interface} does not support the {freq_band} GHz band")
+        return errors
+
+    try:
+        channel = int(config.get('channel') or 0)
+    except (TypeError, ValueError):
+        channel = 0
+    # hostapd applies country_code before starting, which can lift no-IR flags
+    # of the current regdomain (e.g. the world regdomain 00 after boot)
+    country = (config.get('country') or '').upper()
+    regdomain = capabilities.get('regdomain')
+    no_ir_applies = not country or country == regdomain
+
+    if channel and channel in band['disabledChannels']:
+        errors.append(f"Channel {channel} is disabled on {interface} ({freq_band} GHz)")
+    elif channel and channel in band['noIRChannels']:
+        if no_ir_applies:
+            errors.append(f"Channel {channel} is marked no-IR on {interface} ({freq_band} GHz) "
+                          f"in regulatory domain {regdomain or 'unknown'} and cannot be used by an access point")
+    elif channel and channel not in band['channels']:
+        errors.append(f"Channel {channel} is not available on {interface} ({freq_band} GHz)")
+
+    if config.get('ieee80211n') and not band['ht']:
+        errors.append(f"{interface} does not support 802.11n on {freq_band} GHz")
+
+    if config.get('ieee80211ac') and not band['vht']:
+        errors.append(f"{interface} does not support 802.11ac on {freq_band} GHz")
+
+    if config.get('ieee80211ax') and not band['heAP']:
+        errors.append(f"{interface} does not support 802.11ax in AP mode on {freq_band} GHz")
+
+    return errors
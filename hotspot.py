@@ -0,0 +1,837 @@
+#!/usr/bin/env python3
+"""
+Hotspot process management for hostapd + dnsmasq
+Kept free of the web stack so the CLI can import it quickly
+"""
+
+import subprocess
+import threading
+import time
+import re
+import os
+import psutil
+import json
+from datetime import datetime
+from capabilities import get_capabilities, validate_config
+from steering import BandSteering, CTRL_DIR
+
+# Configuration paths
+STATE_FILE = '/var/run/hostapd_manager.json'
+CONFIG_DIR = '/etc/hostapd_manager'
+HOSTAPD_CONF = f'{CONFIG_DIR}/hostapd.conf'
+DNSMASQ_CONF = f'{CONFIG_DIR}/dnsmasq.conf'
+LAST_CONFIG_FILE = f'{CONFIG_DIR}/last_config.json'
+DNSMASQ_LEASES_FILE = '/var/lib/misc/dnsmasq.leases'
+IP_FORWARD_FILE = '/proc/sys/net/ipv4/ip_forward'
+
+# Disconnected clients remembered for delta status responses
+MAX_REMOVED_CLIENTS = 256
+
+# Seconds a computed status snapshot is shared by all pollers
+STATUS_CACHE_TTL = 1.0
+
+class HotspotManager:
+    def __init__(self, read_only=False):
+        self.hostapd_process = None
+        self.dnsmasq_process = None
+        self.is_running = False
+        self.start_time = None
+        self.config = {}
+        self.lock = threading.Lock()
+        self.log_buffer = []
+        self.steering = None
+        
+        # Inspect-only manager (hotspotctl status/clients): creates and removes
+        # nothing and stays quiet, so it works without root and with --json
+        self.read_only = read_only
+        
+        # Versioned status for conditional/delta responses. Seeded from the
+        # clock so versions keep increasing across restarts of the manager.
+        # Traffic counters and steering stats move on every poll and are not
+        # versioned, or the ETag would never match while anyone is watching.
+        self.state_lock = threading.Lock()
+        self.version = int(time.time() * 1000)
+        self.delta_floor = self.version
+        self.section_versions = {
+            'status': self.version, 'config': self.version, 'clients': self.version,
+            'logs': self.version
+        }
+        self.section_data = {}
+        self.clients_data = {}
+        self.client_versions = {}
+        self.removed_clients = {}
+        self.status_cache = None
+        self.status_cache_lock = threading.Lock()
+        
+        # Ensure config directory exists
+        if not read_only:
+            os.makedirs(CONFIG_DIR, exist_ok=True)
+        
+        # Try to restore state on startup
+        self.restore_state()
+        
+    def save_state(self):
+        """Save current state to file"""
+        try:
+            state = {
+                'is_running': self.is_running,
+                'start_time': self.start_time,
+                'config': self.config,
+                'hostapd_pid': self.hostapd_process.pid if self.hostapd_process else None,
+                'dnsmasq_pid': self.dnsmasq_process.pid if self.dnsmasq_process else None,
+                'timestamp': time.time()
+            }
+            
+            with open(STATE_FILE, 'w') as f:
+                json.dump(state, f, indent=2)
+            
+            # Also save config separately
+            if self.config:
+                with open(LAST_CONFIG_FILE, 'w') as f:
+                    json.dump(self.config, f, indent=2)
+                    
+        except Exception as e:
+            print(f"Error saving state: {e}")
+    
+    def restore_state(self):
+        """Restore state from file"""
+        try:
+            if not os.path.exists(STATE_FILE):
+                return
+            
+            with open(STATE_FILE, 'r') as f:
+                state = json.load(f)
+            
+            # Check if processes are still running
+            hostapd_pid = state.get('hostapd_pid')
+            dnsmasq_pid = state.get('dnsmasq_pid')
+            
+            if hostapd_pid and self.is_process_running(hostapd_pid, 'hostapd'):
+                self.is_running = True
+                self.start_time = state.get('start_time')
+                self.config = state.get('config', {})
+                
+                try:
+                    self.hostapd_process = psutil.Process(hostapd_pid)
+                    if dnsmasq_pid:
+                        self.dnsmasq_process = psutil.Process(dnsmasq_pid)
+                    if not self.read_only:
+                        print(f"✅ Restored connection to running hotspot (PID: {hostapd_pid})")
+                except:
+                    pass
+            else:
+                self.clear_state()
+                if not self.read_only:
+                    print("ℹ️ No active hotspot found")
+                
+        except Exception as e:
+            print(f"Error restoring state: {e}")
+            self.clear_state()
+    
+    def clear_state(self):
+        """Clear state file"""
+        if self.read_only:
+            return
+        
+        try:
+            if os.path.exists(STATE_FILE):
+                os.remove(STATE_FILE)
+        except:
+            pass
+    
+    def is_process_running(self, pid, name):
+        """Check if a process is running"""
+        try:
+            process = psutil.Process(pid)
+            return name in ' '.join(process.cmdline())
+        except:
+            return False
+    
+    def is_alive(self, process):
+        """Check a started (Popen) or restored (psutil) process"""
+        try:
+            if isinstance(process, psutil.Process):
+                return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+            return process.poll() is None
+        except psutil.Error:
+            return False
+        
+    def check_prerequisites(self):
+        """Check if hostapd and dnsmasq are installed"""
+        errors = []
+        
+        # Check root access
+        if os.geteuid() != 0:
+            errors.append("Must run as root (use sudo)")
+        
+        # Check hostapd and dnsmasq (resolved once, memoized)
+        binaries = get_capabilities()['binaries']
+        if not binaries['hostapd']:
+            errors.append("hostapd is not installed. Install with: sudo apt install hostapd")
+        
+        if not binaries['dnsmasq']:
+            errors.append("dnsmasq is not installed. Install with: sudo apt install dnsmasq")
+        
+        return errors
+    
+    def check_config(self, config):
+        """Check config against hostapd features and radio capabilities"""
+        return validate_config(config, get_capabilities())
+    
+    def generate_hostapd_conf(self, config):
+        """Generate hostapd.conf file"""
+        conf_lines = []
+        
+        # Basic interface settings
+        conf_lines.append(f"interface={config.get('wifiInterface', 'wlan0')}")
+        conf_lines.append(f"driver={config.get('driver', 'nl80211')}")
+        conf_lines.append(f"ssid={config.get('ssid', 'OrangePi-Hotspot')}")
+        
+        # Hardware mode based on frequency band
+        freq_band = config.get('freqBand', '2.4')
+        if freq_band == '5':
+            conf_lines.append("hw_mode=a")
+        else:
+            conf_lines.append("hw_mode=g")
+        
+        # Channel
+        channel = config.get('channel', '6' if freq_band == '2.4' else '36')
+        conf_lines.append(f"channel={channel}")
+        
+        # Country code
+        if config.get('country'):
+            conf_lines.append(f"country_code={config['country'].upper()}")
+        
+        # IEEE 802.11n
+        if config.get('ieee80211n'):
+            conf_lines.append("ieee80211n=1")
+            
+            # HT capabilities
+            if config.get('htCapab'):
+                conf_lines.append(f"ht_capab={config['htCapab']}")
+            else:
+                # Default HT capabilities
+                conf_lines.append("ht_capab=[HT40+][SHORT-GI-20][SHORT-GI-40][DSSS_CCK-40]")
+        
+        # IEEE 802.11ac
+        if config.get('ieee80211ac'):
+            conf_lines.append("ieee80211ac=1")
+            
+            # VHT operation
+            conf_lines.append("vht_oper_chwidth=1")
+            
+            # Calculate center frequency
+            try:
+                ch = int(channel)
+                if ch >= 36 and ch <= 48:
+                    center_freq = 42
+                elif ch >= 52 and ch <= 64:
+                    center_freq = 58
+                elif ch >= 100 and ch <= 112:
+                    center_freq = 106
+                elif ch >= 116 and ch <= 128:
+                    center_freq = 122
+                elif ch >= 132 and ch <= 144:
+                    center_freq = 138
+                elif ch >= 149 and ch <= 161:
+                    center_freq = 155
+                else:
+                    center_freq = ch + 6
+                
+                conf_lines.append(f"vht_oper_centr_freq_seg0_idx={center_freq}")
+            except:
+                conf_lines.append("vht_oper_centr_freq_seg0_idx=42")
+            
+            # VHT capabilities
+            if config.get('vhtCapab'):
+                conf_lines.append(f"vht_capab={config['vhtCapab']}")
+        
+        # IEEE 802.11ax (WiFi 6)
+        if config.get('ieee80211ax'):
+            conf_lines.append("ieee80211ax=1")
+            if config.get('heCapab'):
+                conf_lines.append(f"he_capab={config['heCapab']}")
+        
+        # Security settings
+        password = config.get('password', '')
+        if password:
+            wpa_version = config.get('wpaVersion', '2')
+            
+            if wpa_version == '3':
+                # WPA3
+                conf_lines.append("wpa=2")
+                conf_lines.append("wpa_key_mgmt=SAE")
+                conf_lines.append("rsn_pairwise=CCMP")
+                conf_lines.append(f"sae_password={password}")
+            else:
+                # WPA/WPA2
+                conf_lines.append(f"wpa={wpa_version}")
+                conf_lines.append("wpa_key_mgmt=WPA-PSK")
+                
+                if config.get('psk'):
+                    conf_lines.append(f"wpa_psk={password}")
+                else:
+                    conf_lines.append(f"wpa_passphrase={password}")
+                
+                conf_lines.append("rsn_pairwise=CCMP")
+        
+        # Authentication algorithm
+        conf_lines.append("auth_algs=1")
+        
+        # WMM (WiFi Multimedia)
+        conf_lines.append("wmm_enabled=1")
+        
+        # Hidden SSID
+        if config.get('hidden'):
+            conf_lines.append("ignore_broadcast_ssid=1")
+        
+        # Client isolation
+        if config.get('isolate'):
+            conf_lines.append("ap_isolate=1")
+        
+        # MAC filtering
+        if config.get('macFilter'):
+            conf_lines.append("macaddr_acl=1")
+            if config.get('macFilterAccept'):
+                conf_lines.append(f"accept_mac_file={config['macFilterAccept']}")
+        
+        # Additional hostapd options
+        if config.get('hostapdDebug'):
+            conf_lines.append(f"logger_syslog_level={config['hostapdDebug']}")
+        
+        # Max number of stations
+        if config.get('maxStations'):
+            conf_lines.append(f"max_num_sta={config['maxStations']}")
+        
+        # Band steering needs the control interface and 802.11v BSS transition
+        if config.get('bandSteering'):
+            conf_lines.append(f"ctrl_interface={CTRL_DIR}")
+            conf_lines.append("bss_transition=1")
+        
+        return '\n'.join(conf_lines) + '\n'
+    
+    def generate_dnsmasq_conf(self, config):
+        """Generate dnsmasq.conf file"""
+        conf_lines = []
+        
+        interface = config.get('wifiInterface', 'wlan0')
+        gateway = config.get('gateway', '192.168.12.1')
+        
+        # Interface
+        conf_lines.append(f"interface={interface}")
+        conf_lines.append("bind-interfaces")
+        
+        # DHCP range
+        dhcp_start = config.get('dhcpStart', '192.168.12.10')
+        dhcp_end = config.get('dhcpEnd', '192.168.12.100')
+        lease_time = config.get('leaseTime', '12h')
+        
+        conf_lines.append(f"dhcp-range={dhcp_start},{dhcp_end},{lease_time}")
+        
+        # Gateway
+        conf_lines.append(f"dhcp-option=3,{gateway}")
+        
+        # DNS servers
+        dns_servers = config.get('dhcpDns', '8.8.8.8,8.8.4.4')
+        for dns in dns_servers.split(','):
+            conf_lines.append(f"dhcp-option=6,{dns.strip()}")
+        
+        # Domain
+        if config.get('domain'):
+            conf_lines.append(f"domain={config['domain']}")
+        
+        # Additional hosts file
+        if config.get('hostsFile') and os.path.exists(config['hostsFile']):
+            conf_lines.append(f"addn-hosts={config['hostsFile']}")
+        
+        # No DNS
+        if config.get('noDns'):
+            conf_lines.append("port=0")
+        
+        return '\n'.join(conf_lines) + '\n'
+    
+    def setup_interface(self, config):
+        """Setup network interface"""
+        interface = config.get('wifiInterface', 'wlan0')
+        gateway = config.get('gateway', '192.168.12.1')
+        
+        try:
+            # Bring interface down
+            subprocess.run(['ip', 'link', 'set', interface, 'down'], check=True)
+            
+            # Set IP address
+            subprocess.run(['ip', 'addr', 'flush', 'dev', interface], check=True)
+            subprocess.run(['ip', 'addr', 'add', f'{gateway}/24', 'dev', interface], check=True)
+            
+            # Bring interface up
+            subprocess.run(['ip', 'link', 'set', interface, 'up'], check=True)
+            
+            return True
+        except Exception as e:
+            print(f"Error setting up interface: {e}")
+            return False
+    
+    def setup_nat(self, config):
+        """Setup NAT and IP forwarding"""
+        if config.get('noInternet'):
+            return True
+        
+        try:
+            wifi_iface = config.get('wifiInterface', 'wlan0')
+            inet_iface = config.get('internetInterface', 'eth0')
+            
+            # Enable IP forwarding
+            with open(IP_FORWARD_FILE, 'w') as f:
+                f.write('1\n')
+            
+            # Setup iptables NAT
+            subprocess.run(['iptables', '-t', 'nat', '-A', 'POSTROUTING', 
+                          '-o', inet_iface, '-j', 'MASQUERADE'], check=True)
+            subprocess.run(['iptables', '-A', 'FORWARD', '-i', inet_iface, 
+                          '-o', wifi_iface, '-m', 'state', '--state', 
+                          'RELATED,ESTABLISHED', '-j', 'ACCEPT'], check=True)
+            subprocess.run(['iptables', '-A', 'FORWARD', '-i', wifi_iface, 
+                          '-o', inet_iface, '-j', 'ACCEPT'], check=True)
+            
+            return True
+        except Exception as e:
+            print(f"Error setting up NAT: {e}")
+            return False
+    
+    def cleanup_nat(self, config):
+        """Cleanup NAT rules"""
+        try:
+            wifi_iface = config.get('wifiInterface', 'wlan0')
+            inet_iface = config.get('internetInterface', 'eth0')
+            
+            # Remove iptables rules
+            subprocess.run(['iptables', '-t', 'nat', '-D', 'POSTROUTING', 
+                          '-o', inet_iface, '-j', 'MASQUERADE'], 
+                         stderr=subprocess.DEVNULL)
+            subprocess.run(['iptables', '-D', 'FORWARD', '-i', inet_iface, 
+                          '-o', wifi_iface, '-m', 'state', '--state', 
+                          'RELATED,ESTABLISHED', '-j', 'ACCEPT'],
+                         stderr=subprocess.DEVNULL)
+            subprocess.run(['iptables', '-D', 'FORWARD', '-i', wifi_iface, 
+                          '-o', inet_iface, '-j', 'ACCEPT'],
+                         stderr=subprocess.DEVNULL)
+        except:
+            pass
+    
+    def start(self, config):
+        """Start the WiFi hotspot"""
+        with self.lock:
+            if self.is_running:
+                return {'success': False, 'error': 'Hotspot is already running'}
+            
+            # Check prerequisites
+            prereq_errors = self.check_prerequisites()
+            if prereq_errors:
+                return {
+                    'success': False,
+                    'error': 'Prerequisites check failed',
+                    'details': prereq_errors
+                }
+            
+            # Reject settings the system cannot support before touching anything
+            config_errors = self.check_config(config)
+            if config_errors:
+                return {
+                    'success': False,
+                    'error': 'Configuration not supported by this system',
+                    'details': config_errors
+                }
+            
+            try:
+                # Generate configuration files
+                hostapd_conf = self.generate_hostapd_conf(config)
+                dnsmasq_conf = self.generate_dnsmasq_conf(config)
+                
+                # Write configuration files
+                with open(HOSTAPD_CONF, 'w') as f:
+                    f.write(hostapd_conf)
+                
+                with open(DNSMASQ_CONF, 'w') as f:
+                    f.write(dnsmasq_conf)
+                
+                # Setup network interface
+                if not self.setup_interface(config):
+                    return {'success': False, 'error': 'Failed to setup network interface'}
+                
+                # Start dnsmasq
+                if not config.get('noDnsmasq'):
+                    self.dnsmasq_process = subprocess.Popen(
+                        ['dnsmasq', '-C', DNSMASQ_CONF, '-d'],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        universal_newlines=True
+                    )
+                    time.sleep(1)
+                    
+                    if self.dnsmasq_process.poll() is not None:
+                        return {'success': False, 'error': 'Failed to start dnsmasq'}
+                
+                # Setup NAT
+                if not self.setup_nat(config):
+                    if self.dnsmasq_process:
+                        self.dnsmasq_process.terminate()
+                    return {'success': False, 'error': 'Failed to setup NAT'}
+                
+                # Start hostapd
+                self.hostapd_process = subprocess.Popen(
+                    ['hostapd', HOSTAPD_CONF],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    universal_newlines=True
+                )
+                
+                # Wait and check if hostapd started successfully
+                time.sleep(2)
+                if self.hostapd_process.poll() is not None:
+                    stdout, stderr = self.hostapd_process.communicate()
+                    self.cleanup_nat(config)
+                    if self.dnsmasq_process:
+                        self.dnsmasq_process.terminate()
+                    return {
+                        'success': False,
+                        'error': 'hostapd failed to start',
+                        'details': stderr or stdout
+                    }
+                
+                self.is_running = True
+                self.start_time = time.time()
+                self.config = config
+                self.save_state()
+                
+                # Start log monitoring
+                threading.Thread(target=self.monitor_hostapd_logs, daemon=True).start()
+                
+                result = {
+                    'success': True,
+                    'hostapd_pid': self.hostapd_process.pid,
+                    'dnsmasq_pid': self.dnsmasq_process.pid if self.dnsmasq_process else None,
+                    'config_file': HOSTAPD_CONF
+                }
+                
+                # An engine left over from a hostapd that died must not stay attached
+                self.stop_steering()
+                if config.get('bandSteering'):
+                    warning = self.start_steering(config)
+                    if warning:
+                        result['warning'] = warning
+                
+                self.status_cache = None
+                return result
+                
+            except Exception as e:
+                return {'success': False, 'error': str(e)}
+    
+    def stop(self):
+        """Stop the WiFi hotspot"""
+        with self.lock:
+            if not self.is_running:
+                return {'success': False, 'error': 'Hotspot is not running'}
+            
+            try:
+                # Stop band steering (releases any delayed clients)
+                self.stop_steering()
+                
+                # Stop hostapd
+                if self.hostapd_process:
+                    self.hostapd_process.terminate()
+                    try:
+                        self.hostapd_process.wait(timeout=5)
+                    except (subprocess.TimeoutExpired, psutil.TimeoutExpired):
+                        self.hostapd_process.kill()
+                    self.hostapd_process = None
+                
+                # Stop dnsmasq
+                if self.dnsmasq_process:
+                    self.dnsmasq_process.terminate()
+                    try:
+                        self.dnsmasq_process.wait(timeout=5)
+                    except (subprocess.TimeoutExpired, psutil.TimeoutExpired):
+                        self.dnsmasq_process.kill()
+                    self.dnsmasq_process = None
+                
+                # Cleanup NAT
+                self.cleanup_nat(self.config)
+                
+                # Flush interface
+                interface = self.config.get('wifiInterface', 'wlan0')
+                try:
+                    subprocess.run(['ip', 'addr', 'flush', 'dev', interface])
+                    subprocess.run(['ip', 'link', 'set', interface, 'down'])
+                except:
+                    pass
+                
+                self.is_running = False
+                self.start_time = None
+                self.log_buffer = []
+                self.clear_state()
+                self.status_cache = None
+                
+                return {'success': True}
+                
+            except Exception as e:
+                return {'success': False, 'error': str(e)}
+    
+    def start_steering(self, config):
+        """Steer clients between this AP and the peer AP on the other band"""
+        freq_band = config.get('freqBand', '2.4')
+        peer_band = '2.4' if freq_band == '5' else '5'
+        steering = BandSteering(
+            {freq_band: config.get('wifiInterface', 'wlan0'), peer_band: config['steeringInterface']},
+            options=config.get('steeringOptions'),
+            log=self.add_log
+        )
+        try:
+            steering.start()
+            self.steering = steering
+        except Exception as e:
+            warning = f"Band steering disabled: {e}"
+            self.add_log(warning)
+            return warning
+        return None
+    
+    def stop_steering(self):
+        """Stop band steering, releasing any delayed clients"""
+        steering, self.steering = self.steering, None
+        if steering:
+            steering.stop()
+    
+    def add_log(self, message):
+        """Append a message to the log buffer and bump the logs version"""
+        with self.state_lock:
+            self.version += 1
+            self.section_versions['logs'] = self.version
+            self.log_buffer.append({
+                'timestamp': datetime.now().isoformat(),
+                'message': message,
+                'version': self.version
+            })
+            if len(self.log_buffer) > 100:
+                self.log_buffer.pop(0)
+    
+    def monitor_hostapd_logs(self):
+        """Monitor hostapd output"""
+        if not self.hostapd_process:
+            return
+        
+        try:
+            for line in self.hostapd_process.stdout:
+                self.add_log(line.strip())
+        except:
+            pass
+    
+    def get_status(self):
+        """Get current hotspot status"""
+        uptime = 0
+        if self.is_running and self.start_time:
+            uptime = int(time.time() - self.start_time)
+        
+        # Check if processes are still alive
+        if self.is_running:
+            if self.hostapd_process and not self.is_alive(self.hostapd_process):
+                self.is_running = False
+                self.start_time = None
+                self.stop_steering()
+                self.clear_state()
+        
+        return {
+            'isRunning': self.is_running,
+            'uptime': uptime,
+            'config': self.config,
+            'logs': self.log_buffer[-20:] if self.log_buffer else [],
+            'hostapd_pid': self.hostapd_process.pid if self.hostapd_process else None,
+            'dnsmasq_pid': self.dnsmasq_process.pid if self.dnsmasq_process else None
+        }
+    
+    def track_section(self, name, data):
+        """Bump the section version if its data changed (state_lock held)"""
+        if self.section_data.get(name) != data:
+            self.version += 1
+            self.section_versions[name] = self.version
+            self.section_data[name] = data
+    
+    def track_clients(self, clients):
+        """Record per-client versions and disconnects (state_lock held)"""
+        current = {client['mac']: client for client in clients}
+        changed = [mac for mac, client in current.items() if self.clients_data.get(mac) != client]
+        removed = [mac for mac in self.clients_data if mac not in current]
+        if not changed and not removed:
+            return
+        
+        self.version += 1
+        self.section_versions['clients'] = self.version
+        for mac in changed:
+            self.clients_data[mac] = current[mac]
+            self.client_versions[mac] = self.version
+            self.removed_clients.pop(mac, None)
+        for mac in removed:
+            del self.clients_data[mac]
+            del self.client_versions[mac]
+            self.removed_clients[mac] = self.version
+        
+        # Forget old disconnects; older deltas fall back to a full response
+        while len(self.removed_clients) > MAX_REMOVED_CLIENTS:
+            mac = min(self.removed_clients, key=self.removed_clients.get)
+            self.delta_floor = max(self.delta_floor, self.removed_clients.pop(mac))
+    
+    def collect_status(self):
+        """Status, clients and stats, computed at most once per STATUS_CACHE_TTL for all pollers"""
+        with self.status_cache_lock:
+            cached = self.status_cache
+            if cached and time.monotonic() - cached['time'] < STATUS_CACHE_TTL:
+                return cached
+            
+            status = self.get_status()
+            clients = self.get_connected_clients()
+            config = status['config'] or {}
+            cached = {
+                'time': time.monotonic(),
+                'status': status,
+                'clients': clients,
+                'wifiStats': self.get_interface_stats(config.get('wifiInterface', 'wlan0')),
+                'internetStats': self.get_interface_stats(config.get('internetInterface', 'eth0')),
+                'steering': self.steering.get_stats() if self.steering else None
+            }
+            
+            with self.state_lock:
+                self.track_section('status', (status['isRunning'], status['hostapd_pid'], status['dnsmasq_pid']))
+                self.track_section('config', status['config'])
+                self.track_clients(clients)
+            
+            self.status_cache = cached
+            return cached
+    
+    def get_status_snapshot(self, since=None):
+        """Get versioned status and clients, or only what changed after `since`"""
+        collected = self.collect_status()
+        status = collected['status']
+        clients = collected['clients']
+        
+        with self.state_lock:
+            # Counters and steering stats are small and unversioned: always sent
+            snapshot = {
+                'version': self.version,
+                'versions': dict(self.section_versions),
+                'clientCount': len(clients),
+                'wifiStats': collected['wifiStats'],
+                'internetStats': collected['internetStats'],
+                'steering': collected['steering']
+            }
+            
+            # Unknown or too old (e.g. from a previous run): send everything
+            if since is None or since < self.delta_floor or since > self.version:
+                snapshot.update({
+                    'full': True,
+                    # Logs read live so they line up with the version
+                    'status': dict(status, logs=self.log_buffer[-20:]),
+                    'clients': clients
+                })
+                return snapshot
+            
+            delta_status = {key: status[key] for key in ('isRunning', 'uptime', 'hostapd_pid', 'dnsmasq_pid')}
+            delta_status['logs'] = [log for log in self.log_buffer if log.get('version', 0) > since]
+            if self.section_versions['config'] > since:
+                delta_status['config'] = status['config']
+            
+            snapshot.update({
+                'full': False,
+                'status': delta_status,
+                'clients': [self.clients_data[mac] for mac, version in self.client_versions.items() if version > since],
+                'removedClients': [mac for mac, version in self.removed_clients.items() if version > since]
+            })
+            return snapshot
+    
+    def get_connected_clients(self):
+        """Get list of connected clients"""
+        clients_dict = {}
+        
+        if not self.is_running:
+            return []
+        
+        try:
+            interface = self.config.get('wifiInterface', 'wlan0')
+            
+            # Method 1: Parse hostapd logs
+            for log in self.log_buffer:
+                msg = log.get('message', '')
+                if 'AP-STA-CONNECTED' in msg:
+                    match = re.search(r'([0-9a-fA-F:]{17})', msg)
+                    if match:
+                        mac = match.group(1).lower()
+                        clients_dict[mac] = {'mac': mac, 'ip': None, 'hostname': None}
+                elif 'AP-STA-DISCONNECTED' in msg:
+                    match = re.search(r'([0-9a-fA-F:]{17})', msg)
+                    if match:
+                        mac = match.group(1).lower()
+                        if mac in clients_dict:
+                            del clients_dict[mac]
+            
+            # Method 2: Use iw station dump
+            result = subprocess.run(
+                ['iw', 'dev', interface, 'station', 'dump'],
+                capture_output=True,
+                text=True,
+                timeout=2
+            )
+            
+            if result.returncode == 0:
+                current_mac = None
+                for line in result.stdout.split('\n'):
+                    line = line.strip()
+                    if line.startswith('Station'):
+                        mac = line.split()[1].lower()
+                        current_mac = mac
+                        if mac not in clients_dict:
+                            clients_dict[mac] = {'mac': mac, 'ip': None, 'hostname': None, 'signal': None}
+                    elif 'signal:' in line and current_mac:
+                        signal_strength = line.split(':')[1].strip().split()[0]
+                        clients_dict[current_mac]['signal'] = signal_strength
+            
+            # Method 3: Get IP from DHCP leases
+            if os.path.exists(DNSMASQ_LEASES_FILE):
+                with open(DNSMASQ_LEASES_FILE, 'r') as f:
+                    for line in f:
+                        parts = line.strip().split()
+                        if len(parts) >= 3:
+                            mac = parts[1].lower()
+                            ip = parts[2]
+                            hostname = parts[3] if len(parts) > 3 else None
+                            
+                            if mac in clients_dict:
+                                clients_dict[mac]['ip'] = ip
+                                clients_dict[mac]['hostname'] = hostname or f"Device-{ip.split('.')[-1]}"
+        
+        except Exception as e:
+            print(f"Error getting clients: {e}")
+        
+        return list(clients_dict.values())
+    
+    def get_interface_stats(self, interface):
+        """Get network interface statistics"""
+        try:
+            stats = psutil.net_io_counters(pernic=True)
+            if interface in stats:
+                return {
+                    'txBytes': stats[interface].bytes_sent,
+                    'rxBytes': stats[interface].bytes_recv,
+                    'txPackets': stats[interface].packets_sent,
+                    'rxPackets': stats[interface].packets_recv
+                }
+        except:
+            pass
+        
+        return {'txBytes': 0, 'rxBytes': 0, 'txPackets': 0, 'rxPackets': 0}
+    
+    def get_last_config(self):
+        """Get last saved configuration"""
+        try:
+            if os.path.exists(LAST_CONFIG_FILE):
+                with open(LAST_CONFIG_FILE, 'r') as f:
+                    return json.load(f)
+        except:
+            pass
+        return None
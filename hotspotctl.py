@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Command line interface for the WiFi Hotspot Manager
+Drives HotspotManager directly; Flask is only imported when the UI is requested
+
+Usage:
+    sudo python3 -m hotspotctl start --config /etc/hostapd_manager/last_config.json
+    sudo python3 -m hotspotctl daemon --ui
+    sudo python3 -m hotspotctl stop
+    sudo python3 -m hotspotctl steer --band 2.4=wlan0 --band 5=wlan1
+    python3 -m hotspotctl status --json
+    python3 -m hotspotctl clients
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+
+from hotspot import HotspotManager, LAST_CONFIG_FILE, STATE_FILE
+from steering import BandSteering, CTRL_DIR
+
+
+def sd_notify(state):
+    """Send a state update to systemd when running under Type=notify"""
+    address = os.environ.get('NOTIFY_SOCKET')
+    if not address:
+        return False
+
+    # Abstract namespace socket
+    if address.startswith('@'):
+        address = '\0' + address[1:]
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.connect(address)
+            sock.sendall(state.encode())
+        return True
+    except OSError:
+        return False
+
+
+def require_root():
+    if os.geteuid() != 0:
+        print("ERROR: This command must be run as root (use sudo)", file=sys.stderr)
+        sys.exit(1)
+
+
+def load_config(path):
+    """Read a JSON config, or None (after printing why) when it cannot be read"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot read config {path}: {e}", file=sys.stderr)
+        return None
+
+
+def print_result(result):
+    """Print a manager result and return the exit code"""
+    if result.get('success'):
+        return 0
+
+    print(f"❌ {result.get('error')}", file=sys.stderr)
+    details = result.get('details')
+    if isinstance(details, list):
+        for detail in details:
+            print(f"   - {detail}", file=sys.stderr)
+    elif details:
+        print(f"   {details}", file=sys.stderr)
+    return 1
+
+
+def serve_ui(manager, host, port):
+    """Import the web stack and serve the UI in a background thread"""
+    import app as web
+
+    web.init_manager(manager)
+    thread = threading.Thread(
+        target=web.app.run,
+        kwargs={'host': host, 'port': port, 'debug': False, 'use_reloader': False},
+        daemon=True
+    )
+    thread.start()
+    print(f"🌐 Web UI on http://{host}:{port}")
+
+
+def run_foreground(args, notify):
+    """Bring the hotspot up and keep it running until signalled"""
+    require_root()
+
+    manager = HotspotManager()
+    if manager.is_running:
+        print(f"✅ Hotspot already running (SSID: {manager.config.get('ssid', 'Unknown')})")
+    else:
+        config = load_config(args.config)
+        if config is None:
+            result = {'success': False, 'error': f'Cannot read config {args.config}'}
+        else:
+            result = manager.start(config)
+            print_result(result)
+
+        if result.get('success'):
+            print(f"✅ Hotspot started (SSID: {manager.config.get('ssid')}, "
+                  f"hostapd PID: {result['hostapd_pid']})")
+            if result.get('warning'):
+                print(f"⚠️  {result['warning']}", file=sys.stderr)
+        elif not args.ui:
+            if notify:
+                sd_notify(f"STATUS=Failed: {result.get('error')}")
+            return 1
+        else:
+            # Fresh install or a bad saved config: the UI is where it gets fixed
+            print("ℹ️  Hotspot not started, serving the web UI")
+
+    if notify:
+        if manager.is_running:
+            state = f"Serving {manager.config.get('ssid')}"
+        else:
+            state = f"Hotspot not started ({result.get('error')}), web UI available"
+        sd_notify(f"READY=1\nSTATUS={state}\nMAINPID={os.getpid()}")
+
+    # The AP is up (or could not be started), the web stack can take its time now
+    if args.ui:
+        serve_ui(manager, args.host, args.port)
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
+    # Ping the watchdog at half the configured interval
+    interval = 2.0
+    watchdog_usec = os.environ.get('WATCHDOG_USEC')
+    if notify and watchdog_usec:
+        interval = min(interval, int(watchdog_usec) / 2e6)
+
+    exit_code = 0
+    stopped = not manager.is_running
+    while not stop_event.wait(interval):
+        if not os.path.exists(STATE_FILE):
+            # Stopped from the web UI or hotspotctl stop
+            if not args.ui:
+                print("ℹ️  Hotspot was stopped")
+                break
+
+            # Keep serving the UI so the stop sticks and the AP can be started again from it
+            if not stopped:
+                stopped = True
+                # Notice dead processes now, which also stops band steering
+                manager.get_status()
+                print("ℹ️  Hotspot was stopped, web UI stays available")
+                if notify:
+                    sd_notify("STATUS=Hotspot stopped, web UI available")
+        else:
+            # Started again from another process
+            if stopped and not manager.is_running:
+                manager.restore_state()
+
+            if not manager.get_status()['isRunning']:
+                print("❌ hostapd exited unexpectedly", file=sys.stderr)
+                exit_code = 1
+                break
+
+            if stopped:
+                stopped = False
+                print(f"✅ Hotspot running (SSID: {manager.config.get('ssid')})")
+                if notify:
+                    sd_notify(f"STATUS=Serving {manager.config.get('ssid')}")
+
+        if notify and watchdog_usec:
+            sd_notify("WATCHDOG=1")
+
+    if stop_event.is_set():
+        if notify:
+            sd_notify("STOPPING=1")
+        if manager.is_running:
+            print("Stopping hotspot...")
+            exit_code = print_result(manager.stop())
+
+    return exit_code
+
+
+def cmd_start(args):
+    return run_foreground(args, notify=False)
+
+
+def cmd_daemon(args):
+    return run_foreground(args, notify=True)
+
+
+def cmd_stop(args):
+    require_root()
+    result = HotspotManager().stop()
+    if result.get('success'):
+        print("✅ Hotspot stopped")
+    return print_result(result)
+
+
+def cmd_status(args):
+    snapshot = HotspotManager(read_only=True).get_status_snapshot()
+    status = snapshot['status']
+    config = status['config'] or {}
+    clients = snapshot['clients']
+
+    if args.json:
+        print(json.dumps(snapshot, indent=2))
+    elif status['isRunning']:
+        print(f"Status:   running (uptime {status['uptime']}s)")
+        print(f"SSID:     {config.get('ssid', 'Unknown')}")
+        print(f"hostapd:  PID {status['hostapd_pid']}")
+        print(f"dnsmasq:  PID {status['dnsmasq_pid']}")
+        print(f"Clients:  {len(clients)}")
+        if snapshot['steering']:
+            counters = snapshot['steering']['counters']
+            print(f"Steering: {counters['associationsDelayed']} delayed, "
+                  f"{counters['btmRequested']} BTM requests, {counters['steered']} steered")
+    else:
+        print("Status:   stopped")
+
+    return 0 if status['isRunning'] else 3
+
+
+def cmd_clients(args):
+    clients = HotspotManager(read_only=True).get_connected_clients()
+
+    if args.json:
+        print(json.dumps(clients, indent=2))
+        return 0
+
+    if not clients:
+        print("No clients connected")
+    for client in clients:
+        signal_strength = f"{client['signal']} dBm" if client.get('signal') else '-'
+        print(f"{client['mac']}  {client.get('ip') or '-':15}  "
+              f"{client.get('hostname') or '-':20}  {signal_strength}")
+    return 0
+
+
+def cmd_steer(args):
+    """Run band steering alone between two running hostapd instances"""
+    try:
+        interfaces = dict(band.split('=', 1) for band in args.band)
+        options = json.loads(args.options) if args.options else None
+        steering = BandSteering(interfaces, options=options, ctrl_dir=args.ctrl_dir)
+        steering.start()
+    except Exception as e:
+        print(f"❌ Cannot start band steering: {e}", file=sys.stderr)
+        return 1
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
+    while not stop_event.wait(args.stats_interval or 1):
+        if args.stats_interval:
+            print(json.dumps(steering.get_stats()))
+
+    steering.stop()
+    return 0
+
+
+def cmd_ui(args):
+    require_root()
+    import app as web
+
+    manager = web.init_manager()
+    errors = manager.check_prerequisites()
+    if errors:
+        for error in errors:
+            print(f"  ❌ {error}", file=sys.stderr)
+        return 1
+
+    web.app.run(host=args.host, port=args.port, debug=False)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='hotspotctl', description='WiFi Hotspot Manager')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    for name, func, help_text in (
+        ('start', cmd_start, 'start the hotspot and stay in the foreground'),
+        ('daemon', cmd_daemon, 'like start, with sd_notify readiness for systemd'),
+    ):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('--config', default=LAST_CONFIG_FILE,
+                             help=f'JSON config file (default: {LAST_CONFIG_FILE})')
+        command.add_argument('--ui', action='store_true', help='also serve the web UI')
+        command.add_argument('--host', default='0.0.0.0')
+        command.add_argument('--port', type=int, default=5000)
+        command.set_defaults(func=func)
+
+    command = commands.add_parser('stop', help='stop the running hotspot')
+    command.set_defaults(func=cmd_stop)
+
+    command = commands.add_parser('status', help='show hotspot status')
+    command.add_argument('--json', action='store_true', help='print the /api/status payload')
+    command.set_defaults(func=cmd_status)
+
+    command = commands.add_parser('clients', help='list connected clients')
+    command.add_argument('--json', action='store_true')
+    command.set_defaults(func=cmd_clients)
+
+    command = commands.add_parser('steer', help='run band steering between two hostapd instances')
+    command.add_argument('--band', action='append', required=True, metavar='BAND=IFACE',
+                         help='band and interface, given twice (e.g. 2.4=wlan0 and 5=wlan1)')
+    command.add_argument('--ctrl-dir', default=CTRL_DIR, help=f'hostapd ctrl_interface (default: {CTRL_DIR})')
+    command.add_argument('--options', help='JSON steering options (thresholds, timings)')
+    command.add_argument('--stats-interval', type=float, default=0,
+                         help='print steering stats as JSON every N seconds')
+    command.set_defaults(func=cmd_steer)
+
+    command = commands.add_parser('ui', help='serve the web UI only (same as app.py)')
+    command.add_argument('--host', default='0.0.0.0')
+    command.add_argument('--port', type=int, default=5000)
+    command.set_defaults(func=cmd_ui)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
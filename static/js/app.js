@@ -2,6 +2,16 @@
 let isRunning = false;
 let updateInterval = null;
 let lastStats = { wifi: {}, internet: {} };
+let capabilities = null;
+let statusVersion = null;
+let clientsByMac = new Map();
+let uptimeBase = 0;
+let uptimeAt = 0;
+let lastStatsAt = 0;
+
+// Traffic counters are not part of the status ETag; skip If-None-Match once
+// they are this old (ms) so the traffic display keeps moving
+const STATS_MAX_AGE = 10000;
 
 // Channel definitions
 const CHANNELS = {
@@ -62,6 +72,7 @@ async function init() {
     // Initialize channel list for default frequency (2.4 GHz)
     updateChannelList('2.4');
     
+    await loadCapabilities();
     await checkStatus();
     await loadLastConfig();
     setupEventListeners();
@@ -96,8 +107,13 @@ function setupEventListeners() {
     // Update channel list when frequency band changes
     document.getElementById('freqBand').addEventListener('change', (e) => {
         updateChannelList(e.target.value);
+        applyCapabilities();
     });
     
+    // Re-check supported settings when the radio or country changes
+    document.getElementById('wifiInterface').addEventListener('change', applyCapabilities);
+    document.getElementById('country').addEventListener('change', applyCapabilities);
+    
     // Auto-enable 802.11n when 802.11ac is enabled (ac requires n)
     document.getElementById('ieee80211ac').addEventListener('change', (e) => {
         if (e.target.checked) {
@@ -148,6 +164,93 @@ function updateChannelList(freqBand) {
     }
 }
 
+// Load hostapd and radio capabilities
+async function loadCapabilities() {
+    try {
+        const response = await fetch('/api/capabilities');
+        capabilities = await response.json();
+        
+        if (capabilities.hostapd) {
+            addLog(`hostapd ${capabilities.hostapd.version || '(unknown version)'} detected`);
+        }
+        
+        applyCapabilities();
+    } catch (error) {
+        console.error('Error loading capabilities:', error);
+        addLog(`Error loading capabilities: ${error.message}`, 'error');
+    }
+}
+
+// Disable settings the installed hostapd or selected radio cannot support
+function applyCapabilities() {
+    if (!capabilities) return;
+    
+    const features = (capabilities.hostapd && capabilities.hostapd.features) || {};
+    const phyName = capabilities.interfaces[document.getElementById('wifiInterface').value];
+    const phy = phyName ? capabilities.phys[phyName] : null;
+    const band = phy ? phy.bands[document.getElementById('freqBand').value] : null;
+    
+    // Frequency bands offered by the radio
+    Array.from(document.getElementById('freqBand').options).forEach(option => {
+        option.disabled = phy ? !phy.bands[option.value] : false;
+    });
+    
+    // Channels the radio can use as an access point on the selected band.
+    // hostapd applies the country code first, which can lift no-IR flags of
+    // the current regulatory domain (e.g. the world domain 00 after boot).
+    const country = document.getElementById('country').value.trim().toUpperCase();
+    const noIRApplies = !country || country === capabilities.regdomain;
+    const channelSelect = document.getElementById('channel');
+    Array.from(channelSelect.options).forEach(option => {
+        const channel = parseInt(option.value, 10);
+        const noIR = band && band.noIRChannels.includes(channel);
+        option.disabled = band ? !(band.channels.includes(channel) || (noIR && !noIRApplies)) : false;
+        if (!band) {
+            option.title = '';
+        } else if (band.disabledChannels.includes(channel)) {
+            option.title = 'Disabled on the selected radio';
+        } else if (noIR) {
+            option.title = noIRApplies
+                ? `No-IR in regulatory domain ${capabilities.regdomain || 'unknown'}: an access point cannot transmit on this channel`
+                : `No-IR in regulatory domain ${capabilities.regdomain || 'unknown'}, may be allowed once country ${country} is applied`;
+        } else if (band.dfsChannels.includes(channel)) {
+            option.title = 'DFS: hostapd checks for radar (CAC) before the AP starts';
+        } else {
+            option.title = band.channels.includes(channel) ? '' : 'Not supported by the selected radio';
+        }
+    });
+    if (channelSelect.selectedOptions[0] && channelSelect.selectedOptions[0].disabled) {
+        const usable = Array.from(channelSelect.options).find(option => !option.disabled);
+        if (usable) channelSelect.value = usable.value;
+    }
+    
+    // WPA3 requires hostapd built with SAE
+    document.querySelector('#wpaVersion option[value="3"]').disabled = features.sae === false;
+    
+    setCapability('ieee80211n', !band || band.ht,
+        'The selected radio does not support 802.11n on this band');
+    setCapability('ieee80211ac', !band || band.vht,
+        'The selected radio does not support 802.11ac on this band');
+    
+    if (features.ieee80211ax === false) {
+        setCapability('ieee80211ax', false,
+            'hostapd was built without CONFIG_IEEE80211AX (see INSTALL_HOSTAPD_2.11.md)');
+    } else {
+        setCapability('ieee80211ax', !band || band.heAP,
+            'The selected radio does not support 802.11ax in AP mode on this band');
+    }
+}
+
+// Enable or disable a WiFi standard checkbox
+function setCapability(id, supported, reason) {
+    const checkbox = document.getElementById(id);
+    if (!checkbox) return;
+    
+    checkbox.disabled = isRunning || !supported;
+    if (!supported) checkbox.checked = false;
+    checkbox.closest('label').title = supported ? '' : reason;
+}
+
 // Toggle advanced settings
 function toggleAdvancedSettings() {
     const advancedSettings = document.getElementById('advancedSettings');
@@ -365,6 +468,7 @@ function restoreConfig(config) {
     }
     if (config.macFilterAccept) document.getElementById('macFilterAccept').value = config.macFilterAccept;
     if (config.hostsFile) document.getElementById('hostsFile').value = config.hostsFile;
+    if (config.steeringInterface) document.getElementById('steeringInterface').value = config.steeringInterface;
     
     // Checkboxes
     document.getElementById('ieee80211n').checked = config.ieee80211n || false;
@@ -379,6 +483,9 @@ function restoreConfig(config) {
     document.getElementById('noDns').checked = config.noDns || false;
     document.getElementById('noDnsmasq').checked = config.noDnsmasq || false;
     document.getElementById('psk').checked = config.psk || false;
+    document.getElementById('bandSteering').checked = config.bandSteering || false;
+    
+    applyCapabilities();
 }
 
 // Get configuration from form
@@ -420,7 +527,9 @@ function getConfig() {
         noInternet: document.getElementById('noInternet').checked,
         noDns: document.getElementById('noDns').checked,
         noDnsmasq: document.getElementById('noDnsmasq').checked,
-        psk: document.getElementById('psk').checked
+        psk: document.getElementById('psk').checked,
+        bandSteering: document.getElementById('bandSteering').checked,
+        steeringInterface: document.getElementById('steeringInterface').value
     };
     
     if (!config.noInternet) {
@@ -450,6 +559,11 @@ async function startHotspot() {
         return;
     }
     
+    if (config.bandSteering && !config.steeringInterface) {
+        alert('Band steering needs the interface of the AP on the other band');
+        return;
+    }
+    
     // Validate 802.11ac on 5GHz
     if (config.ieee80211ac && config.freqBand !== '5') {
         alert('802.11ac requires 5 GHz frequency band');
@@ -479,6 +593,9 @@ async function startHotspot() {
                 addLog(`  dnsmasq PID: ${data.dnsmasq_pid}`, 'success');
             }
             addLog(`  Config file: ${data.config_file}`, 'success');
+            if (data.warning) {
+                addLog(`⚠ ${data.warning}`, 'warning');
+            }
             
             setRunningState(true);
             updateCurrentConfigDisplay(config);
@@ -622,6 +739,7 @@ function setRunningState(running) {
         inputs.forEach(input => input.disabled = false);
         document.getElementById('loadLastConfig').disabled = false;
         document.getElementById('internetInterface').disabled = document.getElementById('noInternet').checked;
+        applyCapabilities();
     }
     
     lucide.createIcons();
@@ -630,8 +748,26 @@ function setRunningState(running) {
 // Update status
 async function updateStatus() {
     try {
-        const response = await fetch('/api/status');
+        // Ask only for what changed since the last version we have
+        const options = { cache: 'no-store', headers: {} };
+        let url = '/api/status';
+        if (statusVersion !== null) {
+            url += `?since=${statusVersion}`;
+            if (Date.now() - lastStatsAt < STATS_MAX_AGE) {
+                options.headers['If-None-Match'] = `W/"${statusVersion}"`;
+            }
+        }
+        
+        const response = await fetch(url, options);
+        
+        // Nothing versioned changed since the last poll; traffic shows the last counters
+        if (response.status === 304) {
+            updateUptime();
+            return;
+        }
+        
         const data = await response.json();
+        statusVersion = data.version;
         
         // Check if still running
         if (!data.status.isRunning && isRunning) {
@@ -642,66 +778,23 @@ async function updateStatus() {
         }
         
         // Update uptime
-        document.getElementById('uptime').textContent = formatUptime(data.status.uptime);
+        uptimeBase = data.status.uptime;
+        uptimeAt = Date.now();
+        updateUptime();
         
-        // Update clients
-        document.getElementById('clientCount').textContent = data.clientCount;
+        // Update clients (full list or changed/removed ones)
+        const removedClients = data.removedClients || [];
+        if (data.full) clientsByMac.clear();
+        removedClients.forEach(mac => clientsByMac.delete(mac));
+        data.clients.forEach(client => clientsByMac.set(client.mac, client));
         
-        const clientList = document.getElementById('clientList');
-        if (data.clients.length === 0) {
-            clientList.innerHTML = `
-                <div class="empty-state">
-                    <i data-lucide="wifi-off" style="width: 48px; height: 48px; margin: 0 auto 12px;"></i>
-                    <p>No clients connected yet</p>
-                </div>
-            `;
-            lucide.createIcons();
-        } else {
-            clientList.innerHTML = data.clients.map(client => {
-                const hostname = client.hostname || 'Unknown Device';
-                const ip = client.ip || 'Obtaining IP...';
-                const mac = client.mac;
-                const signal = client.signal ? `Signal: ${client.signal} dBm` : '';
-                
-                return `
-                    <div class="client-item">
-                        <div class="client-header">
-                            <span class="client-name">
-                                <i data-lucide="smartphone" style="width: 14px; height: 14px; display: inline-block; vertical-align: middle;"></i>
-                                ${hostname}
-                            </span>
-                            <span class="client-ip">${ip}</span>
-                        </div>
-                        <div class="client-mac">${mac}</div>
-                        ${signal ? `<div style="font-size: 11px; color: #a0aec0; margin-top: 4px;">${signal}</div>` : ''}
-                    </div>
-                `;
-            }).join('');
-            lucide.createIcons();
+        document.getElementById('clientCount').textContent = data.clientCount;
+        if (data.full || data.clients.length > 0 || removedClients.length > 0) {
+            renderClients();
         }
         
-        // Calculate rates
-        const wifiTxRate = lastStats.wifi.txBytes ? 
-            (data.wifiStats.txBytes - lastStats.wifi.txBytes) / 2 : 0;
-        const wifiRxRate = lastStats.wifi.rxBytes ? 
-            (data.wifiStats.rxBytes - lastStats.wifi.rxBytes) / 2 : 0;
-        
-        document.getElementById('txRate').textContent = formatBytes(wifiTxRate) + '/s';
-        document.getElementById('rxRate').textContent = formatBytes(wifiRxRate) + '/s';
-        
-        // Update traffic stats
-        document.getElementById('wifiTx').textContent = formatBytes(data.wifiStats.txBytes);
-        document.getElementById('wifiRx').textContent = formatBytes(data.wifiStats.rxBytes);
-        document.getElementById('ethTx').textContent = formatBytes(data.internetStats.txBytes);
-        document.getElementById('ethRx').textContent = formatBytes(data.internetStats.rxBytes);
-        
-        const total = data.wifiStats.txBytes + data.wifiStats.rxBytes + 
-                      data.internetStats.txBytes + data.internetStats.rxBytes;
-        document.getElementById('totalTraffic').textContent = formatBytes(total);
-        
-        // Save last stats
-        lastStats.wifi = data.wifiStats;
-        lastStats.internet = data.internetStats;
+        // Update traffic (sent with every full or delta response)
+        updateTraffic(data.wifiStats, data.internetStats);
         
         // Parse logs for client events
         if (data.status.logs && data.status.logs.length > 0) {
@@ -744,6 +837,86 @@ async function updateStatus() {
     }
 }
 
+// Update uptime from the last server value plus local elapsed time
+function updateUptime() {
+    const elapsed = uptimeAt ? Math.floor((Date.now() - uptimeAt) / 1000) : 0;
+    document.getElementById('uptime').textContent = formatUptime(uptimeBase + elapsed);
+}
+
+// Render the client list
+function renderClients() {
+    const clientList = document.getElementById('clientList');
+    const clients = Array.from(clientsByMac.values());
+    
+    if (clients.length === 0) {
+        clientList.innerHTML = `
+            <div class="empty-state">
+                <i data-lucide="wifi-off" style="width: 48px; height: 48px; margin: 0 auto 12px;"></i>
+                <p>No clients connected yet</p>
+            </div>
+        `;
+    } else {
+        clientList.innerHTML = clients.map(client => {
+            const hostname = client.hostname || 'Unknown Device';
+            const ip = client.ip || 'Obtaining IP...';
+            const mac = client.mac;
+            const signal = client.signal ? `Signal: ${client.signal} dBm` : '';
+            
+            return `
+                <div class="client-item">
+                    <div class="client-header">
+                        <span class="client-name">
+                            <i data-lucide="smartphone" style="width: 14px; height: 14px; display: inline-block; vertical-align: middle;"></i>
+                            ${hostname}
+                        </span>
+                        <span class="client-ip">${ip}</span>
+                    </div>
+                    <div class="client-mac">${mac}</div>
+                    ${signal ? `<div style="font-size: 11px; color: #a0aec0; margin-top: 4px;">${signal}</div>` : ''}
+                </div>
+            `;
+        }).join('');
+    }
+    lucide.createIcons();
+}
+
+// Update traffic rates and totals (null stats means unavailable)
+function updateTraffic(wifiStats, internetStats) {
+    const now = Date.now();
+    const elapsed = lastStatsAt ? (now - lastStatsAt) / 1000 : 0;
+    
+    if (!wifiStats) {
+        document.getElementById('txRate').textContent = formatBytes(0) + '/s';
+        document.getElementById('rxRate').textContent = formatBytes(0) + '/s';
+        lastStatsAt = now;
+        return;
+    }
+    
+    // Calculate rates
+    const wifiTxRate = lastStats.wifi.txBytes && elapsed ?
+        (wifiStats.txBytes - lastStats.wifi.txBytes) / elapsed : 0;
+    const wifiRxRate = lastStats.wifi.rxBytes && elapsed ?
+        (wifiStats.rxBytes - lastStats.wifi.rxBytes) / elapsed : 0;
+    
+    document.getElementById('txRate').textContent = formatBytes(wifiTxRate) + '/s';
+    document.getElementById('rxRate').textContent = formatBytes(wifiRxRate) + '/s';
+    
+    // Update traffic stats
+    document.getElementById('wifiTx').textContent = formatBytes(wifiStats.txBytes);
+    document.getElementById('wifiRx').textContent = formatBytes(wifiStats.rxBytes);
+    document.getElementById('ethTx').textContent = formatBytes(internetStats.txBytes);
+    document.getElementById('ethRx').textContent = formatBytes(internetStats.rxBytes);
+    
+    const total = wifiStats.txBytes + wifiStats.rxBytes +
+                  internetStats.txBytes + internetStats.rxBytes;
+    document.getElementById('totalTraffic').textContent = formatBytes(total);
+    
+    // Save last stats
+    lastStats.wifi = wifiStats;
+    lastStats.internet = internetStats;
+    lastStatsAt = now;
+}
+
 // Start updates
 function startUpdates() {
     updateStatus();
@@ -757,6 +930,9 @@ function stopUpdates() {
         updateInterval = null;
     }
     lastStats = { wifi: {}, internet: {} };
+    lastStatsAt = 0;
+    statusVersion = null;
+    clientsByMac.clear();
 }
 
 // Format bytes
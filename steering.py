@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Band steering and client load balancing across dual-band radios
+Drives two hostapd instances (same SSID) through their control interfaces
+"""
+
+import os
+import re
+import select
+import socket
+import tempfile
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+CTRL_DIR = '/var/run/hostapd'
+
+STEERING_DEFAULTS = {
+    'probeWindow': 30,        # seconds a probe on the preferred band counts as "dual-band"
+    'minPreferredRssi': -75,  # weakest preferred band probe signal worth steering to (dBm)
+    'minLegacyRssi': -80,     # weakest legacy band probe signal worth steering to (dBm)
+    'holdTime': 10,           # seconds legacy band association is delayed
+    'maxHoldProbes': 8,       # stop delaying after this many legacy band probes
+    'loadImbalance': 4,       # extra stations on one band before balancing
+    'maxSteerPerRound': 2,    # BTM requests per balancing round
+    'steerCooldown': 120,     # seconds before the same client is delayed/steered again
+    'btmTimeout': 5,          # seconds to wait for the client to show up on the target
+    'interval': 5             # seconds between balancing rounds
+}
+
+EVENT_PREFIX = re.compile(r'^(?:IFNAME=\S+ )?<\d+>')
+
+# hostapd logs RX-PROBE-REQUEST at MSG_EXCESSIVE, below the MSG_INFO monitor default
+MSG_EXCESSIVE = 0
+MAC_RE = r'([0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){5})'
+
+
+def operating_class(channel):
+    """Global operating class for a 20 MHz channel (BTM neighbor entries)"""
+    if channel <= 13:
+        return 81
+    if channel == 14:
+        return 82
+    if 36 <= channel <= 48:
+        return 115
+    if 52 <= channel <= 64:
+        return 118
+    if 100 <= channel <= 144:
+        return 121
+    return 125
+
+
+class HostapdControl:
+    """Client for one hostapd control socket (ctrl_interface)"""
+
+    def __init__(self, interface, ctrl_dir=CTRL_DIR):
+        self.interface = interface
+        self.path = os.path.join(ctrl_dir, interface)
+        self.local_path = None
+        self.sock = None
+        self.lock = threading.Lock()
+
+    def open(self):
+        self.local_path = os.path.join(
+            tempfile.gettempdir(), f'hotspot_ctrl_{os.getpid()}_{id(self)}')
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(self.local_path)
+        self.sock.connect(self.path)
+        return self
+
+    def close(self):
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+        if self.local_path and os.path.exists(self.local_path):
+            os.remove(self.local_path)
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def request(self, command, timeout=2.0):
+        """Send a command and return the reply text"""
+        with self.lock:
+            # Drop a late reply to an earlier, timed out request
+            while select.select([self.sock], [], [], 0)[0]:
+                self.sock.recv(65536)
+
+            self.sock.send(command.encode())
+            deadline = time.monotonic() + timeout
+            while True:
+                if not select.select([self.sock], [], [], max(0, deadline - time.monotonic()))[0]:
+                    raise TimeoutError(f"{self.interface}: no reply to {command.split()[0]}")
+                reply = self.sock.recv(65536).decode(errors='replace')
+                # Events can arrive before the reply once attached
+                if not EVENT_PREFIX.match(reply):
+                    return reply
+
+    def attach(self, level=MSG_EXCESSIVE):
+        """Subscribe this socket to unsolicited events down to level"""
+        if self.request('ATTACH').strip() != 'OK':
+            raise OSError(f"{self.interface}: ATTACH failed")
+        if self.request(f'LEVEL {level}').strip() != 'OK':
+            raise OSError(f"{self.interface}: LEVEL {level} failed")
+
+    def station(self, mac):
+        """Associated station info from STA, or None"""
+        return self.parse_station(self.request(f'STA {mac}'))
+
+    def stations(self):
+        """Walk the associated stations with STA-FIRST/STA-NEXT"""
+        stations = []
+        station = self.parse_station(self.request('STA-FIRST'))
+        while station:
+            stations.append(station)
+            station = self.parse_station(self.request(f"STA-NEXT {station['mac']}"))
+        return stations
+
+    @staticmethod
+    def parse_station(reply):
+        """STA replies start with the MAC address; FAIL or empty when unknown"""
+        lines = reply.strip().splitlines()
+        if not lines or not re.fullmatch(MAC_RE, lines[0].strip()):
+            return None
+        station = {'mac': lines[0].strip().lower()}
+        for line in lines[1:]:
+            key, _, value = line.partition('=')
+            station[key] = value
+        return station
+
+    def recv_event(self):
+        """Read one event, without its <level> prefix"""
+        data = self.sock.recv(65536).decode(errors='replace')
+        return EVENT_PREFIX.sub('', data.strip())
+
+
+class BandSteering:
+    """Steer dual-band clients to the preferred band and balance load"""
+
+    def __init__(self, interfaces, options=None, log=None, ctrl_dir=CTRL_DIR):
+        if len(interfaces) != 2:
+            raise ValueError("Band steering needs exactly two bands")
+
+        # interfaces: {'2.4': 'wlan0', '5': 'wlan1'}; the higher band is preferred
+        self.interfaces = dict(interfaces)
+        self.legacy_band, self.preferred_band = sorted(self.interfaces, key=float)
+        self.options = dict(STEERING_DEFAULTS, **(options or {}))
+        self.log = log or print
+        self.ctrl_dir = ctrl_dir
+
+        self.controls = {}
+        self.event_sockets = {}
+        self.bss = {}
+        self.clients = {}
+        self.counters = {
+            'probes': 0, 'associationsDelayed': 0, 'holdsReleased': 0, 'delayedToPreferred': 0,
+            'btmRequested': 0, 'btmAccepted': 0, 'btmRejected': 0, 'steered': 0, 'steerFailed': 0
+        }
+        self.decisions = deque(maxlen=100)
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """Connect to both hostapd instances and start the event loop"""
+        try:
+            for band, interface in self.interfaces.items():
+                self.controls[band] = HostapdControl(interface, self.ctrl_dir).open()
+                events = HostapdControl(interface, self.ctrl_dir).open()
+                self.event_sockets[band] = events
+                events.attach()
+                self.bss[band] = self.read_bss(band)
+            self.seed_clients()
+        except Exception:
+            self.close()
+            raise
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        self.log(f"Band steering started ({self.legacy_band} GHz: {self.interfaces[self.legacy_band]}, "
+                 f"{self.preferred_band} GHz: {self.interfaces[self.preferred_band]})")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=5)
+            self.thread = None
+
+        # Do not leave clients locked out of the legacy band
+        with self.lock:
+            for mac, client in self.clients.items():
+                if client['heldUntil']:
+                    self.release(mac, 'steering stopped')
+        self.close()
+
+    def close(self):
+        for control in list(self.controls.values()) + list(self.event_sockets.values()):
+            control.close()
+        self.controls = {}
+        self.event_sockets = {}
+
+    def seed_clients(self):
+        """Learn stations associated before steering attached (e.g. after a restart)"""
+        now = time.monotonic()
+        with self.lock:
+            for band, control in self.controls.items():
+                for station in control.stations():
+                    client = self.client(station['mac'])
+                    client['band'] = band
+                    client['lastSeen'] = now
+            loads = self.loads()
+        self.log(f"Band steering found {loads[self.legacy_band]} stations on {self.legacy_band} GHz, "
+                 f"{loads[self.preferred_band]} on {self.preferred_band} GHz")
+
+    def read_bss(self, band):
+        """BSSID and channel of a band's AP from hostapd STATUS"""
+        status = {}
+        for line in self.controls[band].request('STATUS').splitlines():
+            key, _, value = line.partition('=')
+            status[key] = value
+        return {'bssid': status.get('bssid[0]'), 'channel': int(status.get('channel') or 0)}
+
+    def run(self):
+        last_round = time.monotonic()
+        sockets = {control.fileno(): band for band, control in self.event_sockets.items()}
+
+        while not self.stop_event.is_set():
+            try:
+                ready = select.select(list(sockets), [], [], 1.0)[0]
+                for fd in ready:
+                    band = sockets[fd]
+                    self.handle_event(band, self.event_sockets[band].recv_event())
+
+                now = time.monotonic()
+                with self.lock:
+                    self.expire(now)
+                    if now - last_round >= self.options['interval']:
+                        last_round = now
+                        self.balance(now)
+            except Exception as e:
+                self.log(f"Band steering error: {e}")
+                time.sleep(1)
+
+    def handle_event(self, band, event):
+        """Dispatch one hostapd event"""
+        now = time.monotonic()
+        with self.lock:
+            if event.startswith('RX-PROBE-REQUEST'):
+                match = re.search(r'sa=' + MAC_RE + r'.*?signal=(-?\d+)', event)
+                if match:
+                    self.on_probe(band, match.group(1).lower(), int(match.group(2)), now)
+            elif event.startswith('AP-STA-CONNECTED'):
+                match = re.search(MAC_RE, event)
+                if match:
+                    self.on_connect(band, match.group(1).lower(), now)
+            elif event.startswith('AP-STA-DISCONNECTED'):
+                match = re.search(MAC_RE, event)
+                if match:
+                    self.on_disconnect(band, match.group(1).lower())
+            elif event.startswith('BSS-TM-RESP'):
+                match = re.search(MAC_RE + r'.*?status_code=(\d+)', event)
+                if match:
+                    self.on_btm_response(match.group(1).lower(), int(match.group(2)))
+
+    def client(self, mac):
+        return self.clients.setdefault(mac, {
+            'probes': {}, 'band': None, 'heldUntil': None, 'holdProbes': 0,
+            'lastAction': None, 'pending': None, 'lastSeen': time.monotonic()
+        })
+
+    def recent_probe(self, client, band, now):
+        """Signal of a recent, strong enough probe on band, else None"""
+        probe = client['probes'].get(band)
+        if not probe or now - probe['time'] > self.options['probeWindow']:
+            return None
+        threshold = self.options['minPreferredRssi' if band == self.preferred_band else 'minLegacyRssi']
+        return probe['signal'] if probe['signal'] >= threshold else None
+
+    def cooled_down(self, client, now):
+        return client['lastAction'] is None or now - client['lastAction'] >= self.options['steerCooldown']
+
+    def record(self, mac, action, **details):
+        self.decisions.append(dict({'timestamp': datetime.now().isoformat(), 'mac': mac, 'action': action}, **details))
+        text = ', '.join(f'{key}={value}' for key, value in details.items())
+        self.log(f"Steering: {action} {mac}" + (f" ({text})" if text else ''))
+
+    def on_probe(self, band, mac, signal, now):
+        client = self.client(mac)
+        client['lastSeen'] = now
+        probe = client['probes'].setdefault(band, {'count': 0})
+        probe.update({'time': now, 'signal': signal, 'count': probe['count'] + 1})
+        self.counters['probes'] += 1
+
+        # Only unassociated dual-band clients knocking on the legacy band are delayed
+        if band != self.legacy_band or client['band'] is not None:
+            return
+        if self.recent_probe(client, self.preferred_band, now) is None:
+            return
+
+        if client['heldUntil']:
+            client['holdProbes'] += 1
+            if client['holdProbes'] >= self.options['maxHoldProbes']:
+                self.release(mac, 'probe limit reached')
+        elif self.cooled_down(client, now):
+            self.hold(mac, now)
+
+    def hold(self, mac, now):
+        """Delay association on the legacy band via hostapd's deny list"""
+        client = self.clients[mac]
+
+        # hostapd disassociates a station as soon as it is denied, never hold a connected one
+        if self.controls[self.legacy_band].station(mac):
+            client['band'] = self.legacy_band
+            return
+
+        reply = self.controls[self.legacy_band].request(f'DENY_ACL ADD_MAC {mac}')
+        if reply.strip() != 'OK':
+            return
+        client['heldUntil'] = now + self.options['holdTime']
+        client['holdProbes'] = 0
+        client['lastAction'] = now
+        self.counters['associationsDelayed'] += 1
+        self.record(mac, 'delay', band=self.legacy_band,
+                    signal=client['probes'][self.preferred_band]['signal'])
+
+    def release(self, mac, reason):
+        client = self.clients[mac]
+        client['heldUntil'] = None
+        try:
+            self.controls[self.legacy_band].request(f'DENY_ACL DEL_MAC {mac}')
+        except Exception:
+            pass
+        self.counters['holdsReleased'] += 1
+        self.record(mac, 'release', band=self.legacy_band, reason=reason)
+
+    def on_connect(self, band, mac, now):
+        client = self.client(mac)
+        client['band'] = band
+        client['lastSeen'] = now
+
+        if client['heldUntil'] and band == self.preferred_band:
+            self.counters['delayedToPreferred'] += 1
+            self.release(mac, f'joined {band} GHz')
+
+        pending = client['pending']
+        if pending and pending['toBand'] == band:
+            client['pending'] = None
+            self.counters['steered'] += 1
+            self.record(mac, 'steered', to=band)
+
+    def on_disconnect(self, band, mac):
+        client = self.clients.get(mac)
+        if client and client['band'] == band:
+            client['band'] = None
+
+    def on_btm_response(self, mac, status_code):
+        client = self.clients.get(mac)
+        if not client or not client['pending']:
+            return
+        if status_code == 0:
+            self.counters['btmAccepted'] += 1
+            self.record(mac, 'btm-accepted', to=client['pending']['toBand'])
+        else:
+            self.counters['btmRejected'] += 1
+            client['pending'] = None
+            self.record(mac, 'btm-rejected', status=status_code)
+
+    def steer(self, mac, from_band, to_band, signal, reason, now):
+        """Send a BSS Transition Management request pointing at the other band"""
+        target = self.bss[to_band]
+        phy_type = 9 if float(to_band) >= 5 else 7  # VHT / HT
+        neighbor = (f"{target['bssid']},0,{operating_class(target['channel'])},"
+                    f"{target['channel']},{phy_type}")
+        reply = self.controls[from_band].request(
+            f'BSS_TM_REQ {mac} pref=1 abridged=1 valid_int=255 neighbor={neighbor}')
+
+        client = self.clients[mac]
+        client['lastAction'] = now
+        if reply.strip() != 'OK':
+            self.counters['steerFailed'] += 1
+            self.record(mac, 'btm-failed', reply=reply.strip())
+            return
+
+        client['pending'] = {'toBand': to_band, 'time': now}
+        self.counters['btmRequested'] += 1
+        self.record(mac, 'btm-request', **{'from': from_band, 'to': to_band, 'signal': signal, 'reason': reason})
+
+    def expire(self, now):
+        """Release expired holds, time out BTM requests, forget idle clients"""
+        for mac, client in list(self.clients.items()):
+            if client['heldUntil'] and now >= client['heldUntil']:
+                self.release(mac, 'hold expired')
+
+            pending = client['pending']
+            if pending and now - pending['time'] > self.options['btmTimeout']:
+                client['pending'] = None
+                self.counters['steerFailed'] += 1
+                self.record(mac, 'steer-timeout', to=pending['toBand'])
+
+            idle = now - client['lastSeen'] > 10 * self.options['probeWindow']
+            if idle and client['band'] is None and not client['heldUntil'] and not client['pending']:
+                del self.clients[mac]
+
+    def loads(self):
+        loads = {band: 0 for band in self.interfaces}
+        for client in self.clients.values():
+            if client['band'] in loads:
+                loads[client['band']] += 1
+        return loads
+
+    def balance(self, now):
+        """Move stations off the overloaded band when the other band hears them well"""
+        loads = self.loads()
+        for from_band, to_band in ((self.legacy_band, self.preferred_band),
+                                   (self.preferred_band, self.legacy_band)):
+            excess = loads[from_band] - loads[to_band]
+            if excess < self.options['loadImbalance']:
+                continue
+
+            candidates = []
+            for mac, client in self.clients.items():
+                if client['band'] != from_band or client['pending'] or not self.cooled_down(client, now):
+                    continue
+                signal = self.recent_probe(client, to_band, now)
+                if signal is not None:
+                    candidates.append((signal, mac))
+
+            candidates.sort(reverse=True)
+            limit = min(self.options['maxSteerPerRound'], excess // 2)
+            for signal, mac in candidates[:limit]:
+                self.steer(mac, from_band, to_band, signal,
+                           f'load {loads[from_band]}/{loads[to_band]}', now)
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                'interfaces': self.interfaces,
+                'load': self.loads(),
+                'trackedClients': len(self.clients),
+                'counters': dict(self.counters),
+                'decisions': list(self.decisions)[-20:]
+            }